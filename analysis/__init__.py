@@ -1,5 +1,6 @@
 import importlib
 import logging
+from typing import Dict
 
 logger = logging.getLogger("fawkes.analysis")
 
@@ -12,14 +13,20 @@ ANALYZER_MAP = {
     "mips64": "i386_analyzer",  # Placeholder
 }
 
+# arch -> analyzer class, filled on first load of each architecture
+_CLASS_CACHE: Dict[str, type] = {}
+
 def load_analyzer(arch: str, crash_dir: str) -> 'CrashAnalyzer':
-    module_name = ANALYZER_MAP.get(arch, "i386_analyzer")  # Default to i386
-    try:
-        module = importlib.import_module(f"fawkes.analysis.{module_name}")
-        class_name = f"{module_name.split('_')[0].capitalize()}Analyzer"
-        analyzer_class = getattr(module, class_name)
+    analyzer_class = _CLASS_CACHE.get(arch)
+    if analyzer_class is None:
+        module_name = ANALYZER_MAP.get(arch, "i386_analyzer")  # Default to i386
+        try:
+            module = importlib.import_module(f"fawkes.analysis.{module_name}")
+            class_name = f"{module_name.split('_')[0].capitalize()}Analyzer"
+            analyzer_class = getattr(module, class_name)
+        except (ImportError, AttributeError) as e:
+            logger.error(f"Failed to load analyzer for '{arch}': {e}")
+            raise ValueError(f"Invalid crash analyzer for architecture: {arch}")
         logger.debug(f"Loaded analyzer for {arch}: {module_name} (class: {class_name})")
-        return analyzer_class(crash_dir)
-    except (ImportError, AttributeError) as e:
-        logger.error(f"Failed to load analyzer for '{arch}': {e}")
-        raise ValueError(f"Invalid crash analyzer for architecture: {arch}")
+        _CLASS_CACHE[arch] = analyzer_class
+    return analyzer_class(crash_dir)
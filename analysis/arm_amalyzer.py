@@ -1,150 +1,312 @@
 from fawkes.analysis.base import CrashAnalyzer
-import zipfile
 import hashlib
 import json
+import logging
 import re
 import os
+import sys
+from typing import Dict, Set
+
+# Linear-time regex engine (optional - google-re2 cannot backtrack on hostile dumps)
+try:
+    import re2 as _regex
+    HAS_RE2 = True
+except ImportError:
+    _regex = re
+    HAS_RE2 = False
+
+# Faster JSON decoding (optional - orjson parses the raw bytes directly)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Multi-keyword matching (optional - pyahocorasick scans the dump once)
+try:
+    import ahocorasick
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+# Call stack frames ("#0  func ("), optionally with an address
+# ("#1  0x... in func (") and C++ qualification.
+_FRAME_RE = _regex.compile(rb"#\d+\s+(?:0x[0-9a-fA-F]+\s+in\s+)?([\w:<>,~]+)\s*\(")
+
+_WHITESPACE = b" \t\n\r\x0b\x0c"
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+def _has_pc_assignment(data: bytes) -> bool:
+    """True if data contains "PC = 0x<hex>" (any whitespace around "=")."""
+    end = len(data)
+    idx = data.find(b"PC")
+    while idx != -1:
+        i = idx + 2
+        while i < end and data[i] in _WHITESPACE:
+            i += 1
+        if i < end and data[i] == ord("="):
+            i += 1
+            while i < end and data[i] in _WHITESPACE:
+                i += 1
+            if data.startswith(b"0x", i) and i + 2 < end and data[i + 2] in _HEX_DIGITS:
+                return True
+        idx = data.find(b"PC", idx + 2)
+    return False
+
+# Frame-name noise stripped before hashing: template arguments and ::detail:: helpers
+_FRAME_NOISE_RE = re.compile(rb"<[^>]*>|::detail::\w+")
+
+# Keywords rank_exploitability looks for in the lowercased GDB dump
+_RANK_KEYWORDS = (
+    b"pc", b"undefined instruction", b"data abort", b"prefetch abort",
+    b"sp", b"lr", b"0x00000000", b"0x41414141",
+)
+
+if HAS_AHOCORASICK:
+    _RANK_AUTOMATON = ahocorasick.Automaton()
+    for _keyword in _RANK_KEYWORDS:
+        _RANK_AUTOMATON.add_word(_keyword.decode("latin-1"), _keyword)
+    _RANK_AUTOMATON.make_automaton()
+
+def _keyword_hits(data: bytes) -> Set[bytes]:
+    """Return the subset of _RANK_KEYWORDS that occurs anywhere in data."""
+    if HAS_AHOCORASICK:
+        # latin-1 maps each byte onto one code point, so matches are unchanged
+        return {keyword for _, keyword in _RANK_AUTOMATON.iter(data.decode("latin-1"))}
+    return {keyword for keyword in _RANK_KEYWORDS if keyword in data}
+
+def _loads_json(raw: bytes):
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8, which the stdlib path below drops
+    return json.loads(raw.decode(errors="ignore"))
+
+# Signatures are dedup keys, not authenticators: 128 bits of SHA-256 is plenty
+_SIGNATURE_BYTES = 16
+
+# FAWKES_FAST_HASH=1 switches signatures to BLAKE2b-128. Signatures stored
+# by earlier runs were SHA-256 based and will no longer match.
+_FAST_HASH = os.environ.get("FAWKES_FAST_HASH") == "1"
+
+def _new_sha256():
+    """OpenSSL SHA-256 (SHA-NI where available), outside any FIPS policy checks."""
+    try:
+        return hashlib.new("sha256", usedforsecurity=False)
+    except TypeError:  # Python < 3.9
+        return hashlib.sha256()
+
+def _new_digest():
+    if _FAST_HASH:
+        return hashlib.blake2b(digest_size=_SIGNATURE_BYTES)
+    return _new_sha256()
+
+def _signature_digest(data: bytes) -> str:
+    digest = _new_digest()
+    digest.update(data)
+    return digest.digest()[:_SIGNATURE_BYTES].hex()
+
+def _hash_file(path: str) -> str:
+    """Truncated digest of a file, streamed in 1 MiB blocks instead of read whole."""
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, _new_digest)
+        else:
+            digest = _new_digest()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return digest.digest()[:_SIGNATURE_BYTES].hex()
+
+# "Next Steps" block of the _analysis.txt summary, by exploitability rank
+_NEXT_STEPS = {
+    "High": (
+        "- Inspect registers and stack in gdb_output.txt or crash_info.json.\n"
+        "- Check for controlled pointers or code execution.\n"
+    ),
+    "Medium": (
+        "- Review faulting address and stack trace.\n"
+        "- Look for partial control or data corruption.\n"
+    ),
+    "Low": (
+        "- Verify crash reproducibility.\n"
+        "- Check for environmental factors.\n"
+    ),
+}
+_NEXT_STEPS["Unknown"] = _NEXT_STEPS["Low"]
 
 class ARMAnalyzer(CrashAnalyzer):
-    def get_signature(self, crash_zip: str) -> str:
+    def __init__(self, crash_dir: str):
+        super().__init__(crash_dir)
+        self._last_parsed = (None, None)  # (artifacts, parsed) shared by signature and ranking
+
+    def _parse(self, artifacts: Dict[str, bytes]) -> dict:
+        """Parse the crash artifact once for both get_signature and rank_exploitability.
+
+        The result is cached against the artifacts dict itself, which
+        analyze_crash passes unchanged to both calls.
+        """
+        cached_artifacts, parsed = self._last_parsed
+        if cached_artifacts is artifacts:
+            return parsed
+
+        if "gdb_output.txt" in artifacts:
+            # Scanned as raw bytes; no UTF-8 decode of the whole dump
+            gdb_output = artifacts["gdb_output.txt"]
+            call_stack = []
+            # Extract call stack (e.g., #0 func1, #1 func2)
+            for match in _FRAME_RE.finditer(gdb_output):
+                # Interned: the same frame names recur across thousands of crashes
+                name = sys.intern(_FRAME_NOISE_RE.sub(b"", match.group(1)).decode("ascii"))
+                # Collapse runs of the same frame (recursion, tail-call duplication)
+                if not call_stack or call_stack[-1] != name:
+                    call_stack.append(name)
+                    if len(call_stack) == 5:  # Limit to top 5 frames
+                        break
+            faulting_inst = "pc_set" if _has_pc_assignment(gdb_output) else "none"
+            parsed = {
+                "kind": "gdb",
+                "hits": _keyword_hits(gdb_output.lower()),
+                "call_stack": call_stack,
+                "faulting_inst": faulting_inst,
+            }
+        elif "crash_info.json" in artifacts:
+            crash_info = _loads_json(artifacts["crash_info.json"])
+            parsed = {"kind": "json", "crash_info": crash_info}
+        elif "crash.log" in artifacts:
+            parsed = {"kind": "log", "head": artifacts["crash.log"][:100]}
+        else:
+            parsed = {"kind": None}
+
+        self._last_parsed = (artifacts, parsed)
+        return parsed
+
+    def get_signature(self, crash_zip: str, artifacts: Dict[str, bytes]) -> str:
         """Generate a precise crash signature for ARM."""
         try:
-            with zipfile.ZipFile(crash_zip, "r") as zf:
-                if "gdb_output.txt" in zf.namelist():
-                    gdb_output = zf.read("gdb_output.txt").decode(errors="ignore")
-                    # Extract key elements: fault type, function names, instruction
-                    fault_type = "unknown"
-                    call_stack = []
-                    faulting_inst = "none"
-                    
-                    # Common GDB patterns for ARM
-                    if "undefined instruction" in gdb_output.lower():
-                        fault_type = "undefined_instruction"
-                    elif "data abort" in gdb_output.lower():
-                        fault_type = "data_abort"
-                    elif "prefetch abort" in gdb_output.lower():
-                        fault_type = "prefetch_abort"
-                    
-                    # Extract call stack (e.g., #0 func1, #1 func2)
-                    stack_matches = re.findall(r"#\d+\s+(\w+)\s*\(", gdb_output)
-                    call_stack = stack_matches[:5]  # Limit to top 5 frames
-                    
-                    # Extract faulting instruction or PC
-                    pc_match = re.search(r"PC\s*=\s*0x[0-9a-fA-F]+", gdb_output)
-                    if pc_match:
-                        faulting_inst = "pc_set"
-                    
-                    # Combine for signature
-                    sig_parts = [fault_type] + call_stack + [faulting_inst]
-                    sig_str = ":".join(sig_parts)
-                    self.logger.debug(f"Kernel crash signature: {sig_str}")
-                    return hashlib.sha256(sig_str.encode()).hexdigest()
+            parsed = self._parse(artifacts)
+            if parsed["kind"] == "gdb":
+                hits = parsed["hits"]
+                # Extract key elements: fault type, function names, instruction
+                fault_type = "unknown"
                 
-                elif "crash_info.json" in zf.namelist():
-                    crash_info = json.loads(zf.read("crash_info.json").decode(errors="ignore"))
-                    # Use exe, exception, top stack frames, faulting address
-                    exe = crash_info.get("exe", "unknown")
-                    exception = crash_info.get("exception", "unknown").lower()
-                    stack = crash_info.get("stack", [])[:3]  # Top 3 frames
-                    address = crash_info.get("address", "none")
-                    
-                    # Normalize stack to function names or module+offset
-                    stack_str = ":".join(str(frame.get("function", "unknown")) for frame in stack)
-                    sig_parts = [exe, exception, stack_str, address]
-                    sig_str = ":".join(sig_parts)
-                    self.logger.debug(f"User-space crash signature: {sig_str}")
-                    return hashlib.sha256(sig_str.encode()).hexdigest()
+                # Common GDB patterns for ARM
+                if b"undefined instruction" in hits:
+                    fault_type = "undefined_instruction"
+                elif b"data abort" in hits:
+                    fault_type = "data_abort"
+                elif b"prefetch abort" in hits:
+                    fault_type = "prefetch_abort"
                 
-                elif "crash.log" in zf.namelist():
-                    # Fallback for crash.log
-                    crash_log = zf.read("crash.log").decode(errors="ignore")
-                    sig_str = crash_log[:100]  # First 100 chars as heuristic
-                    self.logger.debug(f"Fallback crash.log signature: {sig_str}")
-                    return hashlib.sha256(sig_str.encode()).hexdigest()
+                # Combine for signature
+                sig_parts = [fault_type] + parsed["call_stack"] + [parsed["faulting_inst"]]
+                sig_str = ":".join(sig_parts)
+                self.logger.debug("Kernel crash signature: %s", sig_str)
+                return _signature_digest(sig_str.encode())
+            
+            elif parsed["kind"] == "json":
+                crash_info = parsed["crash_info"]
+                # Use exe, exception, top stack frames, faulting address
+                exe = crash_info.get("exe", "unknown")
+                exception = crash_info.get("exception", "unknown").lower()
+                stack = crash_info.get("stack", [])[:3]  # Top 3 frames
+                address = crash_info.get("address", "none")
+                
+                # Normalize stack to function names or module+offset
+                stack_str = ":".join(sys.intern(str(frame.get("function", "unknown"))) for frame in stack)
+                sig_parts = [exe, exception, stack_str, address]
+                sig_str = ":".join(sig_parts)
+                self.logger.debug("User-space crash signature: %s", sig_str)
+                return _signature_digest(sig_str.encode())
+            
+            elif parsed["kind"] == "log":
+                # Fallback for crash.log: first 100 bytes as heuristic
+                sig_bytes = parsed["head"]
+                self.logger.debug("Fallback crash.log signature: %r", sig_bytes)
+                return _signature_digest(sig_bytes)
         
         except Exception as e:
-            self.logger.error(f"Failed to generate signature for {crash_zip}: {e}")
+            self.logger.error("Failed to generate signature for %s: %s", crash_zip, e)
         
         # Ultimate fallback: hash file content
-        self.logger.warning(f"No valid signature data in {crash_zip}, using file hash")
-        with open(crash_zip, "rb") as f:
-            return hashlib.sha256(f.read()).hexdigest()
+        self.logger.warning("No valid signature data in %s, using file hash", crash_zip)
+        return _hash_file(crash_zip)
 
-    def rank_exploitability(self, crash_zip: str) -> str:
+    def rank_exploitability(self, crash_zip: str, artifacts: Dict[str, bytes]) -> str:
         """Rank exploitability with detailed analysis for ARM crashes."""
         try:
-            with zipfile.ZipFile(crash_zip, "r") as zf:
-                if "gdb_output.txt" in zf.namelist():
-                    gdb_output = zf.read("gdb_output.txt").decode(errors="ignore").lower()
-                    analysis = []
-                    
-                    # Check for control flow issues
-                    if "pc" in gdb_output:
-                        analysis.append("PC corruption detected")
-                        if "0x00000000" in gdb_output or "0x41414141" in gdb_output:
-                            analysis.append("Null or pattern-based PC")
-                            return self._finalize_rank(crash_zip, "High", analysis)
+            parsed = self._parse(artifacts)
+            if parsed["kind"] == "gdb":
+                hits = parsed["hits"]
+                analysis = []
+                
+                # Check for control flow issues
+                if b"pc" in hits:
+                    analysis.append("PC corruption detected")
+                    if b"0x00000000" in hits or b"0x41414141" in hits:
+                        analysis.append("Null or pattern-based PC")
                         return self._finalize_rank(crash_zip, "High", analysis)
-                    
-                    # Instruction issues
-                    if "undefined instruction" in gdb_output:
-                        analysis.append("Undefined instruction executed")
+                    return self._finalize_rank(crash_zip, "High", analysis)
+                
+                # Instruction issues
+                if b"undefined instruction" in hits:
+                    analysis.append("Undefined instruction executed")
+                    return self._finalize_rank(crash_zip, "Medium", analysis)
+                
+                # Memory faults
+                if b"data abort" in hits:
+                    analysis.append("Data abort")
+                    if b"sp" in hits or b"lr" in hits:
+                        analysis.append("Possible stack corruption")
                         return self._finalize_rank(crash_zip, "Medium", analysis)
-                    
-                    # Memory faults
-                    if "data abort" in gdb_output:
-                        analysis.append("Data abort")
-                        if "sp" in gdb_output or "lr" in gdb_output:
-                            analysis.append("Possible stack corruption")
-                            return self._finalize_rank(crash_zip, "Medium", analysis)
-                        return self._finalize_rank(crash_zip, "Low", analysis)
-                    
-                    if "prefetch abort" in gdb_output:
-                        analysis.append("Prefetch abort")
-                        return self._finalize_rank(crash_zip, "Low", analysis)
-                    
-                    # Generic kernel crash
-                    analysis.append("Generic kernel crash")
                     return self._finalize_rank(crash_zip, "Low", analysis)
                 
-                elif "crash_info.json" in zf.namelist():
-                    crash_info = json.loads(zf.read("crash_info.json").decode(errors="ignore"))
-                    exception = crash_info.get("exception", "unknown").lower()
-                    address = crash_info.get("address", "unknown")
-                    stack = crash_info.get("stack", [])
-                    analysis = []
-                    
-                    # Access violations (ARM equivalent: data abort)
-                    if "data abort" in exception:
-                        analysis.append(f"Data abort at {address}")
-                        if "write" in exception:
-                            analysis.append("Write abort, potential overwrite")
-                            return self._finalize_rank(crash_zip, "High", analysis)
-                        elif "execute" in exception:
-                            analysis.append("Execute abort, potential code exec")
-                            return self._finalize_rank(crash_zip, "High", analysis)
-                        analysis.append("Read abort, likely less exploitable")
-                        return self._finalize_rank(crash_zip, "Medium", analysis)
-                    
-                    # Buffer overflow
-                    if "buffer overflow" in exception:
-                        analysis.append("Buffer overflow detected")
-                        if any("stack" in str(frame).lower() for frame in stack):
-                            analysis.append("Stack-based overflow")
-                            return self._finalize_rank(crash_zip, "High", analysis)
-                        return self._finalize_rank(crash_zip, "Medium", analysis)
-                    
-                    # Other exceptions
-                    if "null pointer" in exception:
-                        analysis.append("Null pointer dereference")
-                        return self._finalize_rank(crash_zip, "Low", analysis)
-                    
-                    # Generic user-space crash
-                    analysis.append("Generic user-space crash")
+                if b"prefetch abort" in hits:
+                    analysis.append("Prefetch abort")
                     return self._finalize_rank(crash_zip, "Low", analysis)
+                
+                # Generic kernel crash
+                analysis.append("Generic kernel crash")
+                return self._finalize_rank(crash_zip, "Low", analysis)
+            
+            elif parsed["kind"] == "json":
+                crash_info = parsed["crash_info"]
+                exception = crash_info.get("exception", "unknown").lower()
+                address = crash_info.get("address", "unknown")
+                stack = crash_info.get("stack", [])
+                analysis = []
+                
+                # Access violations (ARM equivalent: data abort)
+                if "data abort" in exception:
+                    analysis.append(f"Data abort at {address}")
+                    if "write" in exception:
+                        analysis.append("Write abort, potential overwrite")
+                        return self._finalize_rank(crash_zip, "High", analysis)
+                    elif "execute" in exception:
+                        analysis.append("Execute abort, potential code exec")
+                        return self._finalize_rank(crash_zip, "High", analysis)
+                    analysis.append("Read abort, likely less exploitable")
+                    return self._finalize_rank(crash_zip, "Medium", analysis)
+                
+                # Buffer overflow
+                if "buffer overflow" in exception:
+                    analysis.append("Buffer overflow detected")
+                    if any("stack" in str(frame).lower() for frame in stack):
+                        analysis.append("Stack-based overflow")
+                        return self._finalize_rank(crash_zip, "High", analysis)
+                    return self._finalize_rank(crash_zip, "Medium", analysis)
+                
+                # Other exceptions
+                if "null pointer" in exception:
+                    analysis.append("Null pointer dereference")
+                    return self._finalize_rank(crash_zip, "Low", analysis)
+                
+                # Generic user-space crash
+                analysis.append("Generic user-space crash")
+                return self._finalize_rank(crash_zip, "Low", analysis)
         
         except Exception as e:
-            self.logger.error(f"Failed to rank exploitability for {crash_zip}: {e}")
+            self.logger.error("Failed to rank exploitability for %s: %s", crash_zip, e)
         
         return self._finalize_rank(crash_zip, "Unknown", ["No analysis possible"])
 
@@ -152,29 +314,15 @@ class ARMAnalyzer(CrashAnalyzer):
         """Log analysis and save summary with unique crash."""
         base_name = os.path.basename(crash_zip).replace(".zip", "")
         summary_file = os.path.join(self.unique_dir, f"{base_name}_analysis.txt")
+        analysis_block = "\n".join(["- " + item for item in analysis])
         summary_content = (
             f"Crash: {crash_zip}\n"
             f"Exploitability: {rank}\n"
-            f"Analysis:\n" + "\n".join(f"- {item}" for item in analysis) + "\n"
-            f"Next Steps:\n"
+            f"Analysis:\n{analysis_block}\n"
+            f"Next Steps:\n{_NEXT_STEPS.get(rank, _NEXT_STEPS['Unknown'])}"
         )
+        self._write_summary(summary_file, summary_content)
         
-        if rank == "High":
-            summary_content += "- Inspect registers and stack in gdb_output.txt or crash_info.json.\n"
-            summary_content += "- Check for controlled pointers or code execution.\n"
-        elif rank == "Medium":
-            summary_content += "- Review faulting address and stack trace.\n"
-            summary_content += "- Look for partial control or data corruption.\n"
-        else:
-            summary_content += "- Verify crash reproducibility.\n"
-            summary_content += "- Check for environmental factors.\n"
-        
-        try:
-            with open(summary_file, "w") as f:
-                f.write(summary_content)
-            self.logger.info(f"Saved crash analysis to {summary_file}")
-        except Exception as e:
-            self.logger.error(f"Failed to save analysis to {summary_file}: {e}")
-        
-        self.logger.info(f"Crash {crash_zip} ranked {rank}: {'; '.join(analysis)}")
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Crash %s ranked %s: %s", crash_zip, rank, "; ".join(analysis))
         return rank
@@ -2,6 +2,115 @@ from abc import ABC, abstractmethod
 import os
 import logging
 import shutil
+import functools
+import mmap
+import sqlite3
+import struct
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, Optional
+
+# Probabilistic pre-filter for signature lookups (optional - pybloom_live)
+try:
+    from pybloom_live import ScalableBloomFilter
+    HAS_BLOOM = True
+except ImportError:
+    HAS_BLOOM = False
+
+def _write_file(path: str, data: bytes):
+    """Write bytes to path with raw os.open/os.write, bypassing the file-object layer."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+def _move(src: str, dest: str):
+    """Move a crash file, using a single rename(2) when src and dest share a filesystem."""
+    try:
+        os.replace(src, dest)
+    except OSError:
+        shutil.move(src, dest)
+
+# Crash artifacts the analyzers understand, in order of preference
+ARTIFACT_NAMES = ("gdb_output.txt", "crash_info.json", "crash.log")
+
+# Zip record layouts for the mmap fast path in _read_artifacts
+_EOCD = struct.Struct("<4sHHHHIIH")
+_CD_ENTRY = struct.Struct("<4sHHHHHHIIIHHHHHII")
+_LOCAL_HEADER = struct.Struct("<4sHHHHHIIIHH")
+_EOCD_SEARCH = _EOCD.size + 0xFFFF  # EOCD plus the longest possible comment
+_ARTIFACT_KEYS = tuple(name.encode() for name in ARTIFACT_NAMES)
+
+def _fast_read_artifact(crash_zip: str):
+    """Read the preferred artifact by walking the central directory on an mmap.
+
+    Returns (name, data), (None, None) when the archive holds no known artifact,
+    or None when the archive needs the full zipfile reader (zip64, encryption,
+    unusual compression, bad CRC or malformed records). Members written with
+    data descriptors are read here too: sizes and CRC come from the central
+    directory, which is authoritative either way.
+    """
+    with open(crash_zip, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return None
+    with mm:
+        try:
+            eocd = mm.rfind(b"PK\x05\x06", max(0, len(mm) - _EOCD_SEARCH))
+            if eocd < 0:
+                return None
+            _, _, _, _, count, cd_size, cd_offset, _ = _EOCD.unpack_from(mm, eocd)
+            if count == 0xFFFF or cd_offset == 0xFFFFFFFF or cd_offset + cd_size != eocd:
+                return None
+            entries = {}
+            off = cd_offset
+            for _ in range(count):
+                (sig, _, _, flags, method, _, _, crc, csize, usize,
+                 nlen, elen, clen, _, _, _, local) = _CD_ENTRY.unpack_from(mm, off)
+                if sig != b"PK\x01\x02":
+                    return None
+                name = mm[off + _CD_ENTRY.size:off + _CD_ENTRY.size + nlen]
+                if name in _ARTIFACT_KEYS:
+                    entries[name] = (flags, method, crc, csize, usize, local)
+                off += _CD_ENTRY.size + nlen + elen + clen
+            for name in _ARTIFACT_KEYS:
+                if name in entries:
+                    break
+            else:
+                return None, None
+            flags, method, crc, csize, usize, local = entries[name]
+            if flags & 0x1 or method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED) \
+                    or 0xFFFFFFFF in (csize, usize, local):
+                return None
+            sig, *_, nlen, elen = _LOCAL_HEADER.unpack_from(mm, local)
+            if sig != b"PK\x03\x04":
+                return None
+            start = local + _LOCAL_HEADER.size + nlen + elen
+            raw = mm[start:start + csize]
+            data = raw if method == zipfile.ZIP_STORED else zlib.decompress(raw, -15)
+            if len(data) != usize or zlib.crc32(data) != crc:
+                return None
+            return name.decode(), data
+        except (struct.error, zlib.error):
+            return None
+
+# Per-process analyzer used by analyze_crashes() pool workers
+_worker_analyzer = None
+
+def _init_worker(analyzer_class: type, crash_dir: str):
+    global _worker_analyzer
+    _worker_analyzer = analyzer_class(crash_dir)
+
+def _signature_job(crash_zip: str) -> str:
+    """Compute a crash signature in a pool worker (no moves, no store writes)."""
+    artifacts = _worker_analyzer._read_artifacts(crash_zip)
+    return _worker_analyzer.get_signature(crash_zip, artifacts)
 
 class CrashAnalyzer(ABC):
     def __init__(self, crash_dir: str):
@@ -11,36 +120,181 @@ class CrashAnalyzer(ABC):
         os.makedirs(self.unique_dir, exist_ok=True)
         os.makedirs(self.dupe_dir, exist_ok=True)
         self.logger = logging.getLogger(f"fawkes.analyzer.{self.__class__.__name__}")
-        self.signatures = {}  # signature -> crash_zip
+        # Known signatures persist across runs in sigs.db, keyed by raw digest
+        # bytes. Opened on first lookup (see _get_store), so analyze_crashes()
+        # pool workers, which only compute signatures, never touch it.
+        self._sigs = None
+        self._bloom = None
+        # Signatures memoized on (abspath, st_mtime_ns, st_size); a rewritten
+        # file gets a new mtime and therefore a fresh cache entry.
+        self._signature_cached = functools.lru_cache(maxsize=4096)(self._compute_signature)
+        self._last_artifacts = (None, {})  # (abspath, artifacts) of the last zip read
+        self._pending_summaries = None  # deque of (path, bytes) while a batch is running
 
     def analyze_crash(self, crash_zip: str):
         """Analyze, dedup, and rank a crash."""
-        signature = self.get_signature(crash_zip)
-        if signature in self.signatures:
-            self._handle_duplicate(crash_zip, self.signatures[signature])
+        st = os.stat(crash_zip)
+        path = os.path.abspath(crash_zip)
+        signature = self._signature_cached(path, st.st_mtime_ns, st.st_size)
+        last_path, artifacts = self._last_artifacts
+        self._last_artifacts = (None, {})
+        # Reuse the artifacts read for the signature unless it was a cache hit
+        self._dedup_and_rank(crash_zip, signature, artifacts if last_path == path else None)
+
+    def analyze_crashes(self, crash_zips: Iterable[str], max_workers: Optional[int] = None):
+        """Analyze a batch of crashes, computing signatures in a process pool.
+
+        Signature work (zip inflate, regex, hashing) fans out across worker
+        processes. Dedup, ranking of unique crashes and the file moves stay in
+        this process so the signature store has a single writer.
+        """
+        crash_zips = list(crash_zips)
+        if not crash_zips:
+            return
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, min(32, len(crash_zips) // (4 * workers)))
+        # Summaries written during the batch are queued and flushed together
+        self._pending_summaries = deque()
+        try:
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                     initargs=(type(self), self.crash_dir)) as executor:
+                signatures = executor.map(_signature_job, crash_zips, chunksize=chunksize)
+                for crash_zip, signature in zip(crash_zips, signatures):
+                    self._dedup_and_rank(crash_zip, signature)
+        finally:
+            self._flush_summaries()
+
+    def _dedup_and_rank(self, crash_zip: str, signature: str, artifacts: Optional[Dict[str, bytes]] = None):
+        original_zip = self._lookup_signature(signature)
+        if original_zip is not None:
+            self._handle_duplicate(crash_zip, original_zip)
         else:
-            exploitability = self.rank_exploitability(crash_zip)
+            if artifacts is None:
+                artifacts = self._read_artifacts(crash_zip)
+            exploitability = self.rank_exploitability(crash_zip, artifacts)
             self._store_unique(crash_zip, signature, exploitability)
 
+    def _compute_signature(self, path: str, mtime_ns: int, size: int) -> str:
+        """Read the crash artifacts and compute the signature (cache miss path)."""
+        artifacts = self._read_artifacts(path)
+        self._last_artifacts = (path, artifacts)
+        return self.get_signature(path, artifacts)
+
+    def _read_artifacts(self, crash_zip: str) -> Dict[str, bytes]:
+        """Open the crash zip once and read the artifact the analyzers consume.
+
+        Only the first of gdb_output.txt, crash_info.json or crash.log found in
+        the archive is read; the result maps that member name to its raw bytes.
+        Plain archives are read straight off an mmap of the central directory;
+        anything else goes through zipfile.
+        """
+        artifacts = {}
+        try:
+            found = _fast_read_artifact(crash_zip)
+            if found is not None:
+                name, data = found
+                if name is not None:
+                    artifacts[name] = data
+                return artifacts
+            with zipfile.ZipFile(crash_zip, "r") as zf:
+                # name -> ZipInfo dict built while parsing the central directory
+                info_map = zf.NameToInfo
+                for name in ARTIFACT_NAMES:
+                    info = info_map.get(name)
+                    if info is not None:
+                        with zf.open(info) as member:
+                            artifacts[name] = member.read()
+                        break
+        except Exception as e:
+            self.logger.error("Failed to read crash artifacts from %s: %s", crash_zip, e)
+        return artifacts
+
+    def _write_summary(self, summary_file: str, content: str):
+        """Write an analysis summary, or queue it when a batch is in progress."""
+        data = content.encode()
+        if self._pending_summaries is not None:
+            self._pending_summaries.append((summary_file, data))
+            return
+        self._save_summary(summary_file, data)
+
+    def _flush_summaries(self):
+        """Write out all queued summaries and leave batch mode."""
+        pending, self._pending_summaries = self._pending_summaries, None
+        while pending:
+            self._save_summary(*pending.popleft())
+
+    def _save_summary(self, summary_file: str, data: bytes):
+        try:
+            _write_file(summary_file, data)
+            self.logger.info("Saved crash analysis to %s", summary_file)
+        except Exception as e:
+            self.logger.error("Failed to save analysis to %s: %s", summary_file, e)
+
+    @staticmethod
+    def _signature_key(signature: str) -> bytes:
+        """Raw digest bytes for a hex signature (half the size of the hex string)."""
+        try:
+            return bytes.fromhex(signature)
+        except ValueError:
+            return signature.encode()
+
+    def _get_store(self) -> sqlite3.Connection:
+        """Open the signature store, and fill the bloom filter, on first use."""
+        if self._sigs is None:
+            sigs = sqlite3.connect(os.path.join(self.crash_dir, "sigs.db"), check_same_thread=False)
+            sigs.execute("PRAGMA journal_mode=WAL;")
+            sigs.execute("CREATE TABLE IF NOT EXISTS sigs (sig BLOB PRIMARY KEY, path TEXT)")
+            sigs.commit()
+            if HAS_BLOOM:
+                self._bloom = ScalableBloomFilter(initial_capacity=10_000, error_rate=1e-4)
+                for (sig,) in sigs.execute("SELECT sig FROM sigs"):
+                    self._bloom.add(sig)
+            self._sigs = sigs
+        return self._sigs
+
+    def close(self):
+        """Close the signature store, if it was opened."""
+        if self._sigs is not None:
+            self._sigs.close()
+            self._sigs = None
+            self._bloom = None
+
+    def _lookup_signature(self, signature: str) -> Optional[str]:
+        """Return the stored crash path for a known signature, or None."""
+        key = self._signature_key(signature)
+        sigs = self._get_store()
+        if self._bloom is not None and key not in self._bloom:
+            return None
+        row = sigs.execute("SELECT path FROM sigs WHERE sig = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def _remember_signature(self, signature: str, crash_zip: str):
+        key = self._signature_key(signature)
+        sigs = self._get_store()
+        sigs.execute("INSERT OR REPLACE INTO sigs (sig, path) VALUES (?, ?)", (key, crash_zip))
+        sigs.commit()
+        if self._bloom is not None:
+            self._bloom.add(key)
+
     @abstractmethod
-    def get_signature(self, crash_zip: str) -> str:
+    def get_signature(self, crash_zip: str, artifacts: Dict[str, bytes]) -> str:
         """Generate a unique signature for deduplication."""
         pass
 
     @abstractmethod
-    def rank_exploitability(self, crash_zip: str) -> str:
+    def rank_exploitability(self, crash_zip: str, artifacts: Dict[str, bytes]) -> str:
         """Rank the crash’s exploitability (e.g., Low, Medium, High)."""
         pass
 
     def _handle_duplicate(self, crash_zip: str, original_zip: str):
         dest = os.path.join(self.dupe_dir, os.path.basename(crash_zip))
-        shutil.move(crash_zip, dest)
-        self.logger.info(f"Duplicate crash moved to {dest} (matches {original_zip})")
+        _move(crash_zip, dest)
+        self.logger.info("Duplicate crash moved to %s (matches %s)", dest, original_zip)
 
     def _store_unique(self, crash_zip: str, signature: str, exploitability: str):
         base_name = os.path.basename(crash_zip).replace(".zip", "")
         dest_name = f"{base_name}_exploitability_{exploitability}.zip"
         dest = os.path.join(self.unique_dir, dest_name)
-        shutil.move(crash_zip, dest)
-        self.signatures[signature] = dest
-        self.logger.info(f"Unique crash saved to {dest} (exploitability: {exploitability})")
+        _move(crash_zip, dest)
+        self._remember_signature(signature, dest)
+        self.logger.info("Unique crash saved to %s (exploitability: %s)", dest, exploitability)
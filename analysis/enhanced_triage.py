@@ -14,14 +14,202 @@ import json
 import re
 import hashlib
 import zipfile
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+from dataclasses import dataclass, replace
 from enum import Enum
+from itertools import islice
 import logging
 
+# SIMD multi-pattern matching (optional - Intel Hyperscan, preferred over RE2)
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
+# Single-pass multi-pattern matching (optional - google-re2's RE2::Set)
+try:
+    import re2
+    HAS_RE2 = True
+except ImportError:
+    HAS_RE2 = False
+
+# Fast non-cryptographic hashing for dedup keys (optional - xxhash)
+try:
+    import xxhash
+    HAS_XXHASH = True
+except ImportError:
+    HAS_XXHASH = False
+
+# Faster JSON decoding (optional - orjson parses the raw bytes directly)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 logger = logging.getLogger("fawkes.triage")
 
 
+def _lowered_text(data: Dict) -> str:
+    """Lowercased raw output + exception, as normalized by _extract_crash_data"""
+    raw_text = data.get('raw_text_lower')
+    if raw_text is None:
+        raw_text = (data.get('raw_output', '') + data.get('exception', '')).lower()
+    return raw_text
+
+
+def _loads_json(raw: bytes):
+    """Decode crash_info.json bytes, with orjson when available"""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8, which the stdlib path below drops
+    return json.loads(raw.decode(errors='ignore'))
+
+
+# FAWKES_FAST_HASH=1 switches stack hashes and signatures to XXH3 (needs
+# xxhash). Hashes stored, and crash_report_<stack_hash>_* files written, by
+# SHA-256 runs will no longer match. Without the opt-in the digests do not
+# depend on which optional packages are installed.
+_FAST_HASH = os.environ.get("FAWKES_FAST_HASH") == "1"
+if _FAST_HASH and not HAS_XXHASH:
+    logger.warning("FAWKES_FAST_HASH=1 needs xxhash; using SHA-256 stack hashes")
+    _FAST_HASH = False
+
+
+def _stack_digest(data: bytes) -> str:
+    """16 hex digit stack hash: truncated SHA-256, or XXH3-64 with FAWKES_FAST_HASH=1"""
+    if _FAST_HASH:
+        return xxhash.xxh3_64_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _signature_digest(data: bytes) -> str:
+    """Crash signature: SHA-256, or XXH3-128 with FAWKES_FAST_HASH=1"""
+    if _FAST_HASH:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
+
+
+# Bytes read from each end of a crash zip for its cache fingerprint. The
+# tail holds the central directory, which carries every member's CRC-32.
+_FINGERPRINT_CHUNK = 64 * 1024
+
+
+def _zip_fingerprint(crash_zip: str) -> Tuple[int, int]:
+    """(size, hash of the first and last 64 KiB) identifying a crash zip's content"""
+    with open(crash_zip, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        head = f.read(_FINGERPRINT_CHUNK)
+        if size > 2 * _FINGERPRINT_CHUNK:
+            f.seek(-_FINGERPRINT_CHUNK, os.SEEK_END)
+        tail = f.read()
+    if HAS_XXHASH:
+        h = xxhash.xxh3_64()
+        h.update(head)
+        h.update(tail)
+        return size, h.intdigest()
+    h = hashlib.blake2b(head, digest_size=8)
+    h.update(tail)
+    return size, int.from_bytes(h.digest(), 'big')
+
+
+# GDB output, matched line by line in _parse_gdb_output. The lookaheads let
+# the engine skip to candidate first characters instead of trying the
+# case-insensitive alternation at every position.
+_GDB_FRAME_RE = re.compile(r'#(\d+)\s+(?:0x[0-9a-fA-F]+\s+in\s+)?([^\n\(]+)')
+_GDB_REG_RE = re.compile(
+    r'(?=[rRpPeE])([re][abcds][xpi]|[re]bp|[re]sp|rip|eip|pc)\s*[=:]\s*(0x[0-9a-fA-F]+)',
+    re.IGNORECASE
+)
+_GDB_FAULT_RE = re.compile(r'fault address\s*[=:]\s*(0x[0-9a-fA-F]+)', re.IGNORECASE)
+_GDB_EXCEPTION_RE = re.compile(
+    r'(?=[sSiIgG])(signal\s+\w+|segmentation fault|illegal instruction|general protection)',
+    re.IGNORECASE
+)
+
+# Addresses and parameter lists stripped from frames before stack hashing
+_FRAME_STRIP_RE = re.compile(r'0x[0-9a-fA-F]+|\([^)]*\)')
+
+# Memory corruption keywords, one alternation instead of a search per keyword
+_CORRUPTION_RE = re.compile(
+    r'corrupt|overflow|overwrite|smash|invalid.{0,8}size|heap.{0,8}metadata|use after free'
+)
+
+# Mitigation keywords, one named group per mitigation. Word boundaries keep
+# "nxdomain" or "depth" from reading as NX or DEP.
+_MITIGATION_RE = re.compile(
+    r'(?P<canary>__stack_chk_fail|stack canary)'
+    r'|(?P<aslr>\baslr\b|\bpie\b)'
+    r'|(?P<dep>\bdep\b|\bnx\b)'
+    r'|(?P<cfi>\bcfi\b|control flow)'
+)
+_MITIGATION_NAMES = (
+    ('canary', 'Stack Canary'),
+    ('aslr', 'ASLR/PIE'),
+    ('dep', 'DEP/NX'),
+    ('cfi', 'CFI'),
+)
+
+# Fuzzer fill patterns (AAAA, BBBB, CCCC, aaaa, bbbb) in register values
+_CTRL_DATA_RE = re.compile(r'(?:41){4}|(?:42){4}|(?:43){4}|a{8}|b{8}', re.IGNORECASE)
+
+# Indirect call/jump through a corrupted target, bounded to one line
+_BRANCH_CORRUPT_RE = re.compile(r'(?:call|jmp)[^\n]{0,120}corrupt')
+
+# Python's "\s" spelled out for engines whose "\s" is narrower: Unicode
+# whitespace for RE2, the ASCII subset for Hyperscan (ASCII text only).
+# RE2's "$" also never matches before a final newline, unlike Python's.
+_UNICODE_SPACE = r'[\t-\r\x1c-\x20\x85\pZ]'
+_ASCII_SPACE = r'[\t-\r\x1c-\x20]'
+_RE2_DOLLAR = r'(?:\n?\z)'
+
+
+def _compile_hyperscan_db(patterns: Sequence[re.Pattern]):
+    """Build a block-mode Hyperscan database over compiled patterns"""
+    # Byte mode: UTF-8 mode multiplies the compile time of the bounded repeats
+    flags = hyperscan.HS_FLAG_SINGLEMATCH
+    db = hyperscan.Database(mode=hyperscan.HS_MODE_BLOCK)
+    db.compile(
+        expressions=[p.pattern.replace(r'\s', _ASCII_SPACE).encode() for p in patterns],
+        ids=list(range(len(patterns))),
+        elements=len(patterns),
+        flags=[flags] * len(patterns)
+    )
+    return db
+
+
+def _compile_pattern_set(patterns: Sequence[re.Pattern]):
+    """
+    Build an RE2::Set over compiled patterns, or None without google-re2
+
+    A set reports every pattern that matches anywhere in one pass over the
+    text, unlike a fused alternation, which hides overlapping matches.
+    """
+    if not HAS_RE2:
+        return None
+    pattern_set = re2.Set.SearchSet()
+    for pattern in patterns:
+        source = re.sub(r'(?<!\\)\$', lambda m: _RE2_DOLLAR, pattern.pattern)
+        pattern_set.Add(source.replace(r'\s', _UNICODE_SPACE))
+    pattern_set.Compile()
+    return pattern_set
+
+
+def _matching_patterns(pattern_set, patterns: Sequence[re.Pattern], text: str) -> Set[int]:
+    """Indices of the patterns that match somewhere in text"""
+    if pattern_set is not None:
+        try:
+            return set(pattern_set.Match(text) or ())
+        except UnicodeEncodeError:  # lone surrogates from crash_info.json
+            pass
+    return {i for i, pattern in enumerate(patterns) if pattern.search(text)}
+
+
 class Severity(Enum):
     """Crash severity levels"""
     CRITICAL = "Critical"
@@ -51,9 +239,41 @@ class VulnType(Enum):
     UNKNOWN = "Unknown"
 
 
+class PatternRule(NamedTuple):
+    """Vulnerability detection pattern and the confidence a match adds"""
+    pattern: re.Pattern
+    weight: float
+    desc: Optional[str] = None
+    register_patterns: Tuple[re.Pattern, ...] = ()
+
+
+class ExploitIndicator(NamedTuple):
+    """Exploitability indicator and the score a match adds"""
+    name: str
+    pattern: re.Pattern
+    score: int
+    severity: Severity
+
+
+class CvePattern(NamedTuple):
+    """Known CVE pattern for similarity matching"""
+    cve: str
+    pattern: re.Pattern
+    similarity_threshold: float
+
+
 @dataclass
 class CrashAnalysis:
     """Complete crash analysis result"""
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10
+    __slots__ = (
+        'crash_id', 'signature', 'stack_hash', 'severity', 'exploitability_score',
+        'vuln_type', 'vuln_class', 'control_flow_hijack', 'memory_corruption',
+        'controlled_data', 'stack_frames', 'registers', 'fault_address',
+        'crash_instruction', 'confidence', 'indicators', 'mitigations',
+        'root_cause', 'suggested_fix', 'similar_cves', 'triage_notes'
+    )
+
     crash_id: str
     signature: str
     stack_hash: str
@@ -76,164 +296,242 @@ class CrashAnalysis:
     similar_cves: List[str]
     triage_notes: List[str]
 
+    def copy(self, **changes) -> 'CrashAnalysis':
+        """Copy with fresh lists and dicts, so the copies share no mutable state"""
+        for name in ('stack_frames', 'indicators', 'mitigations', 'similar_cves', 'triage_notes'):
+            changes.setdefault(name, list(getattr(self, name)))
+        changes.setdefault('registers', dict(self.registers))
+        return replace(self, **changes)
+
     def to_dict(self) -> Dict:
         """Convert to dictionary with enum values as strings"""
-        d = asdict(self)
-        d['severity'] = self.severity.value
-        d['vuln_type'] = self.vuln_type.value
-        return d
+        # Built directly: asdict() deep-copies every field by reflection
+        return {
+            'crash_id': self.crash_id,
+            'signature': self.signature,
+            'stack_hash': self.stack_hash,
+            'severity': self.severity.value,
+            'exploitability_score': self.exploitability_score,
+            'vuln_type': self.vuln_type.value,
+            'vuln_class': self.vuln_class,
+            'control_flow_hijack': self.control_flow_hijack,
+            'memory_corruption': self.memory_corruption,
+            'controlled_data': self.controlled_data,
+            'stack_frames': list(self.stack_frames),
+            'registers': dict(self.registers),
+            'fault_address': self.fault_address,
+            'crash_instruction': self.crash_instruction,
+            'confidence': self.confidence,
+            'indicators': list(self.indicators),
+            'mitigations': list(self.mitigations),
+            'root_cause': self.root_cause,
+            'suggested_fix': self.suggested_fix,
+            'similar_cves': list(self.similar_cves),
+            'triage_notes': list(self.triage_notes)
+        }
+
+
+# Vulnerability detection patterns, compiled once at import and shared by
+# every engine instance
+_VULN_PATTERNS: Dict[VulnType, Tuple[PatternRule, ...]] = {
+    VulnType.BUFFER_OVERFLOW: (
+        PatternRule(
+            pattern=re.compile(r'buffer overflow|stack smashing|__stack_chk_fail'),
+            weight=0.9,
+            register_patterns=(re.compile(r'\b(?:rsp|esp|rbp|ebp)\b[^\n]{0,120}0x[4-9a-fA-F]{8}'),)
+        ),
+        PatternRule(
+            pattern=re.compile(r'strcpy|strcat|sprintf|gets|scanf'),
+            weight=0.6,
+            desc='Unsafe string function'
+        )
+    ),
+    VulnType.STACK_OVERFLOW: (
+        PatternRule(
+            pattern=re.compile(r'stack overflow|stack exhausted'),
+            weight=0.95,
+        ),
+        PatternRule(
+            pattern=re.compile(r'\b(?:rsp|esp)\b[^\n]{0,120}0x[0-9a-f]{1,4}$'),
+            weight=0.7,
+            desc='Stack pointer near zero'
+        )
+    ),
+    VulnType.HEAP_OVERFLOW: (
+        PatternRule(
+            pattern=re.compile(r'(?:heap|malloc)[^\n]{0,120}corrupt|free[^\n]{0,120}invalid'),
+            weight=0.9
+        ),
+        PatternRule(
+            pattern=re.compile(r'corrupted size|invalid next size'),
+            weight=0.85
+        )
+    ),
+    VulnType.USE_AFTER_FREE: (
+        PatternRule(
+            pattern=re.compile(r'use after free|freed memory|double free'),
+            weight=0.9
+        ),
+        PatternRule(
+            pattern=re.compile(r'invalid pointer|freed pointer'),
+            weight=0.7
+        )
+    ),
+    VulnType.NULL_DEREF: (
+        PatternRule(
+            pattern=re.compile(r'null[^\n]{0,120}deref|nullptr|0x0+\s'),
+            weight=0.85
+        ),
+        PatternRule(
+            pattern=re.compile(r'segmentation fault[^\n]{0,120}0x0'),
+            weight=0.8
+        )
+    ),
+    VulnType.FORMAT_STRING: (
+        PatternRule(
+            pattern=re.compile(r'%n|%s[^\n]{0,64}%x|printf[^\n]{0,64}%'),
+            weight=0.7
+        ),
+        PatternRule(
+            pattern=re.compile(r'format string|printf vulnerability'),
+            weight=0.9
+        )
+    ),
+    VulnType.PC_CONTROL: (
+        PatternRule(
+            pattern=re.compile(r'\b(?:rip|eip|pc)\b[^\n]{0,120}0x41414141'),
+            weight=0.95,
+            desc='Program counter overwritten with pattern'
+        ),
+        PatternRule(
+            pattern=re.compile(r'\b(?:rip|eip|pc)\b[^\n]{0,120}corrupted'),
+            weight=0.85
+        )
+    )
+}
+
+# Exploitability indicators
+_EXPLOIT_INDICATORS: Tuple[ExploitIndicator, ...] = (
+    ExploitIndicator(
+        name='PC Control',
+        pattern=re.compile(r'\b(?:rip|eip|pc)\b[^\n]{0,120}0x[4-9a-f]'),
+        score=40,
+        severity=Severity.CRITICAL
+    ),
+    ExploitIndicator(
+        name='Return Address Overwrite',
+        pattern=re.compile(r'return address[^\n]{0,120}overwrit|ret[^\n]{0,120}corrupt'),
+        score=35,
+        severity=Severity.CRITICAL
+    ),
+    ExploitIndicator(
+        name='Stack Corruption',
+        pattern=re.compile(r'stack[^\n]{0,120}corrupt|__stack_chk_fail'),
+        score=30,
+        severity=Severity.HIGH
+    ),
+    ExploitIndicator(
+        name='Arbitrary Write',
+        pattern=re.compile(r'write[^\n]{0,120}arbitrary|write-what-where'),
+        score=35,
+        severity=Severity.CRITICAL
+    ),
+    ExploitIndicator(
+        name='Heap Metadata Corruption',
+        pattern=re.compile(r'heap[^\n]{0,120}metadata|chunk[^\n]{0,120}corrupt'),
+        score=25,
+        severity=Severity.HIGH
+    ),
+    ExploitIndicator(
+        name='ROP Gadgets Available',
+        pattern=re.compile(r'rop|gadget|return-oriented'),
+        score=15,
+        severity=Severity.MEDIUM
+    )
+)
+
+# Known CVE patterns for similarity matching (can be expanded)
+_CVE_PATTERNS: Tuple[CvePattern, ...] = (
+    CvePattern(
+        cve='CVE-2021-3156 (sudo heap overflow)',
+        pattern=re.compile(r'(?:sudo|nss_load_library)[^\n]{0,120}heap'),
+        similarity_threshold=0.8
+    ),
+    CvePattern(
+        cve='CVE-2019-14287 (sudo bypass)',
+        pattern=re.compile(r'sudo[^\n]{0,120}uid[^\n]{0,120}-1'),
+        similarity_threshold=0.7
+    ),
+    # Add more CVE patterns as you discover them
+)
+
+# Every vulnerability, exploit and CVE pattern in one tuple, scanned together
+# once per crash (see EnhancedTriageEngine._scan_all). Ids are positions.
+_VULN_RULES: Tuple[Tuple[VulnType, PatternRule], ...] = tuple(
+    (vuln_type, rule)
+    for vuln_type, rules in _VULN_PATTERNS.items()
+    for rule in rules
+)
+_ALL_PATTERNS: Tuple[re.Pattern, ...] = (
+    tuple(rule.pattern for _, rule in _VULN_RULES)
+    + tuple(ind.pattern for ind in _EXPLOIT_INDICATORS)
+    + tuple(cve.pattern for cve in _CVE_PATTERNS)
+)
+_EXPLOIT_OFFSET = len(_VULN_RULES)
+_CVE_OFFSET = _EXPLOIT_OFFSET + len(_EXPLOIT_INDICATORS)
+_PATTERN_SET = _compile_pattern_set(_ALL_PATTERNS)
+_HS_DB = None  # compiled on first use (see _hyperscan_db)
+
+
+def _hyperscan_db():
+    """Shared Hyperscan database over _ALL_PATTERNS, compiled on first use"""
+    global _HS_DB
+    if _HS_DB is None:
+        _HS_DB = _compile_hyperscan_db(_ALL_PATTERNS)
+    return _HS_DB
+
+
+# Per-process engine used by EnhancedTriageEngine.analyze_crashes() pool workers
+_worker_engine = None
+
+
+def _init_worker():
+    global _worker_engine
+    _worker_engine = EnhancedTriageEngine()
+
+
+def _analyze_job(crash_zip: str) -> 'CrashAnalysis':
+    """Analyze one crash in a pool worker"""
+    return _worker_engine.analyze_crash(crash_zip)
 
 
 class EnhancedTriageEngine:
     """Advanced crash triage and analysis engine"""
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 256):
+        """
+        Args:
+            cache_size: Results kept for zips seen before, keyed by content
+                fingerprint (0 disables the cache)
+        """
         self.logger = logging.getLogger("fawkes.triage.engine")
 
-        # Vulnerability patterns for detection
-        self.vuln_patterns = self._init_vuln_patterns()
-
-        # Exploitability indicators
-        self.exploit_indicators = self._init_exploit_indicators()
-
-        # Known CVE patterns (can be expanded)
-        self.cve_patterns = self._init_cve_patterns()
-
-    def _init_vuln_patterns(self) -> Dict[VulnType, List[Dict]]:
-        """Initialize vulnerability detection patterns"""
-        return {
-            VulnType.BUFFER_OVERFLOW: [
-                {
-                    'pattern': r'buffer overflow|stack smashing|__stack_chk_fail',
-                    'weight': 0.9,
-                    'register_patterns': [r'(rsp|esp|rbp|ebp).*0x[4-9a-fA-F]{8,}']
-                },
-                {
-                    'pattern': r'strcpy|strcat|sprintf|gets|scanf',
-                    'weight': 0.6,
-                    'desc': 'Unsafe string function'
-                }
-            ],
-            VulnType.STACK_OVERFLOW: [
-                {
-                    'pattern': r'stack overflow|stack exhausted',
-                    'weight': 0.95,
-                },
-                {
-                    'pattern': r'(rsp|esp).*0x[0-9a-fA-F]{1,4}$',
-                    'weight': 0.7,
-                    'desc': 'Stack pointer near zero'
-                }
-            ],
-            VulnType.HEAP_OVERFLOW: [
-                {
-                    'pattern': r'heap.*corrupt|malloc.*corrupt|free.*invalid',
-                    'weight': 0.9
-                },
-                {
-                    'pattern': r'corrupted size|invalid next size',
-                    'weight': 0.85
-                }
-            ],
-            VulnType.USE_AFTER_FREE: [
-                {
-                    'pattern': r'use after free|freed memory|double free',
-                    'weight': 0.9
-                },
-                {
-                    'pattern': r'invalid pointer|freed pointer',
-                    'weight': 0.7
-                }
-            ],
-            VulnType.NULL_DEREF: [
-                {
-                    'pattern': r'null.*deref|nullptr|0x0+\s',
-                    'weight': 0.85
-                },
-                {
-                    'pattern': r'segmentation fault.*0x0+',
-                    'weight': 0.8
-                }
-            ],
-            VulnType.FORMAT_STRING: [
-                {
-                    'pattern': r'%n|%s.*%x|printf.*%',
-                    'weight': 0.7
-                },
-                {
-                    'pattern': r'format string|printf vulnerability',
-                    'weight': 0.9
-                }
-            ],
-            VulnType.PC_CONTROL: [
-                {
-                    'pattern': r'(rip|eip|pc).*0x41414141',
-                    'weight': 0.95,
-                    'desc': 'Program counter overwritten with pattern'
-                },
-                {
-                    'pattern': r'(rip|eip|pc).*corrupted',
-                    'weight': 0.85
-                }
-            ]
-        }
+        # LRU of fingerprint -> CrashAnalysis, for crash corpora replayed
+        # through triage again
+        self._cache_size = cache_size
+        self._cache: 'OrderedDict[Tuple[int, int], CrashAnalysis]' = OrderedDict()
 
-    def _init_exploit_indicators(self) -> List[Dict]:
-        """Initialize exploitability indicators"""
-        return [
-            {
-                'name': 'PC Control',
-                'pattern': r'(rip|eip|pc).*0x[4-9a-fA-F]',
-                'score': 40,
-                'severity': Severity.CRITICAL
-            },
-            {
-                'name': 'Return Address Overwrite',
-                'pattern': r'return address.*overwrit|ret.*corrupt',
-                'score': 35,
-                'severity': Severity.CRITICAL
-            },
-            {
-                'name': 'Stack Corruption',
-                'pattern': r'stack.*corrupt|__stack_chk_fail',
-                'score': 30,
-                'severity': Severity.HIGH
-            },
-            {
-                'name': 'Arbitrary Write',
-                'pattern': r'write.*arbitrary|write-what-where',
-                'score': 35,
-                'severity': Severity.CRITICAL
-            },
-            {
-                'name': 'Heap Metadata Corruption',
-                'pattern': r'heap.*metadata|chunk.*corrupt',
-                'score': 25,
-                'severity': Severity.HIGH
-            },
-            {
-                'name': 'ROP Gadgets Available',
-                'pattern': r'rop|gadget|return-oriented',
-                'score': 15,
-                'severity': Severity.MEDIUM
-            }
-        ]
+        # Pattern tables are module-level constants shared by all instances
+        self.vuln_patterns = _VULN_PATTERNS
+        self.exploit_indicators = _EXPLOIT_INDICATORS
+        self.cve_patterns = _CVE_PATTERNS
 
-    def _init_cve_patterns(self) -> List[Dict]:
-        """Initialize known CVE patterns for similarity matching"""
-        return [
-            {
-                'cve': 'CVE-2021-3156 (sudo heap overflow)',
-                'pattern': r'sudo.*heap|nss_load_library.*heap',
-                'similarity_threshold': 0.8
-            },
-            {
-                'cve': 'CVE-2019-14287 (sudo bypass)',
-                'pattern': r'sudo.*uid.*-1',
-                'similarity_threshold': 0.7
-            },
-            # Add more CVE patterns as you discover them
-        ]
+        self._vuln_rules = _VULN_RULES
+        self._all_patterns = _ALL_PATTERNS
+        self._exploit_offset = _EXPLOIT_OFFSET
+        self._cve_offset = _CVE_OFFSET
+        self._pattern_set = _PATTERN_SET
+        self._hs_scratch = None  # per-instance Hyperscan scratch (see _scan_all)
 
     def analyze_crash(self, crash_zip: str, crash_info: Optional[Dict] = None) -> CrashAnalysis:
         """
@@ -248,6 +546,20 @@ class EnhancedTriageEngine:
         """
         self.logger.info(f"Analyzing crash: {crash_zip}")
 
+        # Identical zips give identical results, unless crash_info feeds in
+        key = None
+        if self._cache_size and crash_info is None:
+            try:
+                key = _zip_fingerprint(crash_zip)
+            except OSError:
+                pass  # _extract_crash_data reports unreadable zips
+            cached = self._cache.get(key) if key is not None else None
+            if cached is not None:
+                self._cache.move_to_end(key)
+                self.logger.info(f"Analysis cached: {cached.severity.value} severity, "
+                                 f"{cached.exploitability_score}/100 exploitability")
+                return cached.copy(crash_id=os.path.basename(crash_zip))
+
         # Extract crash data
         data = self._extract_crash_data(crash_zip, crash_info)
 
@@ -315,9 +627,37 @@ class EnhancedTriageEngine:
             triage_notes=triage_notes
         )
 
+        if key is not None:
+            # Cached apart from the returned result, which the caller may modify
+            self._cache[key] = analysis.copy()
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
         self.logger.info(f"Analysis complete: {severity.value} severity, {exploit_score}/100 exploitability")
         return analysis
 
+    def analyze_crashes(self, crash_zips: Iterable[str], max_workers: Optional[int] = None) -> List[CrashAnalysis]:
+        """
+        Analyze a batch of crashes in a process pool
+
+        Each crash is independent, so the zip inflate and pattern scans fan
+        out across worker processes, each with its own engine.
+
+        Args:
+            crash_zips: Paths to crash archives
+            max_workers: Worker processes (default: CPU count)
+
+        Returns:
+            CrashAnalysis objects in the order of crash_zips
+        """
+        crash_zips = list(crash_zips)
+        if not crash_zips:
+            return []
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, min(32, len(crash_zips) // (4 * workers)))
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as executor:
+            return list(executor.map(_analyze_job, crash_zips, chunksize=chunksize))
+
     def _extract_crash_data(self, crash_zip: str, crash_info: Optional[Dict]) -> Dict:
         """Extract and normalize crash data from zip or info dict"""
         data = {
@@ -333,16 +673,19 @@ class EnhancedTriageEngine:
 
         try:
             with zipfile.ZipFile(crash_zip, 'r') as zf:
+                names = set(zf.namelist())
+
                 # Try GDB output first (kernel crashes)
-                if 'gdb_output.txt' in zf.namelist():
+                if 'gdb_output.txt' in names:
                     gdb_output = zf.read('gdb_output.txt').decode(errors='ignore')
                     data['raw_output'] = gdb_output
                     data.update(self._parse_gdb_output(gdb_output))
 
                 # Try crash_info.json (user-space crashes)
-                elif 'crash_info.json' in zf.namelist():
-                    info = json.loads(zf.read('crash_info.json').decode())
-                    data.update(self._parse_crash_info_json(info))
+                elif 'crash_info.json' in names:
+                    raw_info = zf.read('crash_info.json')
+                    if raw_info.strip():
+                        data.update(self._parse_crash_info_json(_loads_json(raw_info)))
 
                 # Fallback to provided crash_info
                 elif crash_info:
@@ -351,33 +694,45 @@ class EnhancedTriageEngine:
         except Exception as e:
             self.logger.error(f"Error extracting crash data: {e}")
 
+        # Lowercased once here; the detection patterns are written in lowercase
+        data['raw_text_lower'] = (data['raw_output'] + data.get('exception', '')).lower()
+
         return data
 
     def _parse_gdb_output(self, gdb_output: str) -> Dict:
-        """Parse GDB output for stack, registers, etc."""
+        """Parse GDB output for stack, registers, etc. in one pass over its lines"""
         data = {
             'stack_frames': [],
             'registers': {},
             'exception': ''
         }
-
-        # Extract stack frames (#0, #1, etc.)
-        stack_matches = re.findall(r'#(\d+)\s+(?:0x[0-9a-fA-F]+\s+in\s+)?([^\n\(]+)', gdb_output)
-        data['stack_frames'] = [frame[1].strip() for frame in stack_matches[:10]]
-
-        # Extract registers
-        reg_matches = re.findall(r'([re][abcds][xpi]|[re]bp|[re]sp|rip|eip|pc)\s*[=:]\s*(0x[0-9a-fA-F]+)', gdb_output, re.IGNORECASE)
-        data['registers'] = {reg[0].lower(): reg[1] for reg in reg_matches}
-
-        # Extract fault address
-        fault_match = re.search(r'fault address\s*[=:]\s*(0x[0-9a-fA-F]+)', gdb_output, re.IGNORECASE)
-        if fault_match:
-            data['fault_address'] = fault_match.group(1)
-
-        # Extract exception type
-        exc_match = re.search(r'(signal\s+\w+|segmentation fault|illegal instruction|general protection)', gdb_output, re.IGNORECASE)
-        if exc_match:
-            data['exception'] = exc_match.group(1)
+        stack_frames = data['stack_frames']
+        registers = data['registers']
+
+        for line in gdb_output.split('\n'):
+            # Extract stack frames (#0, #1, etc.), top 10 only
+            if '#' in line and len(stack_frames) < 10:
+                stack_frames.extend(
+                    frame.group(2).strip()
+                    for frame in islice(_GDB_FRAME_RE.finditer(line), 10 - len(stack_frames))
+                )
+
+            # Extract registers
+            if '0x' in line or '0X' in line:
+                for reg_name, reg_val in _GDB_REG_RE.findall(line):
+                    registers[reg_name.lower()] = reg_val
+
+            # Extract fault address
+            if 'fault_address' not in data:
+                fault_match = _GDB_FAULT_RE.search(line)
+                if fault_match:
+                    data['fault_address'] = fault_match.group(1)
+
+            # Extract exception type
+            if not data['exception']:
+                exc_match = _GDB_EXCEPTION_RE.search(line)
+                if exc_match:
+                    data['exception'] = exc_match.group(1)
 
         return data
 
@@ -399,20 +754,18 @@ class EnhancedTriageEngine:
         Uses normalized function names from top 5 frames
         """
         if not stack_frames:
-            return hashlib.sha256(b'no_stack').hexdigest()[:16]
+            return _stack_digest(b'no_stack')
 
         # Normalize stack frames (remove addresses, keep function names)
         normalized = []
         for frame in stack_frames[:5]:
             # Extract function name, removing addresses and parameters
-            func_name = re.sub(r'0x[0-9a-fA-F]+', '', frame)
-            func_name = re.sub(r'\(.*\)', '', func_name)
-            func_name = func_name.strip()
+            func_name = _FRAME_STRIP_RE.sub('', frame).strip()
             if func_name:
                 normalized.append(func_name)
 
         stack_str = '|'.join(normalized)
-        return hashlib.sha256(stack_str.encode()).hexdigest()[:16]
+        return _stack_digest(stack_str.encode())
 
     def _generate_signature(self, data: Dict) -> str:
         """Generate unique crash signature"""
@@ -422,7 +775,36 @@ class EnhancedTriageEngine:
             '|'.join(data['stack_frames'][:3])
         ]
         sig_str = ':'.join(str(p) for p in sig_parts)
-        return hashlib.sha256(sig_str.encode()).hexdigest()
+        return _signature_digest(sig_str.encode())
+
+    def _scan_all(self, raw_text: str) -> Set[int]:
+        """
+        Match every table pattern against the crash text in one pass
+
+        Returns:
+            Ids (positions in self._all_patterns) of the patterns that match
+        """
+        # Hyperscan matches bytes, so it only takes text where bytes are characters
+        if HAS_HYPERSCAN and raw_text.isascii():
+            db = _hyperscan_db()
+            if self._hs_scratch is None:
+                # The database is shared; scratch space must not be
+                self._hs_scratch = hyperscan.Scratch(db)
+            hits = set()
+
+            def on_match(pattern_id, start, end, flags, context):
+                hits.add(pattern_id)
+
+            db.scan(raw_text.encode('ascii'), match_event_handler=on_match, scratch=self._hs_scratch)
+            return hits
+        return _matching_patterns(self._pattern_set, self._all_patterns, raw_text)
+
+    def _pattern_hits(self, data: Dict) -> Set[int]:
+        """_scan_all result for this crash, computed on first use"""
+        hits = data.get('pattern_hits')
+        if hits is None:
+            hits = data['pattern_hits'] = self._scan_all(_lowered_text(data))
+        return hits
 
     def _detect_vulnerability_type(self, data: Dict) -> Tuple[VulnType, float]:
         """
@@ -431,25 +813,25 @@ class EnhancedTriageEngine:
         Returns:
             (VulnType, confidence_score)
         """
-        scores = {}
-        raw_text = (data.get('raw_output', '') + data.get('exception', '')).lower()
+        totals = {}
+        matched = self._pattern_hits(data)
 
         # Score each vulnerability type
-        for vuln_type, patterns in self.vuln_patterns.items():
-            score = 0.0
-            for pattern_dict in patterns:
-                if re.search(pattern_dict['pattern'], raw_text, re.IGNORECASE):
-                    score += pattern_dict['weight']
-
-                    # Check register patterns if specified
-                    if 'register_patterns' in pattern_dict:
-                        for reg_name, reg_val in data.get('registers', {}).items():
-                            for reg_pattern in pattern_dict['register_patterns']:
-                                if re.search(reg_pattern, f"{reg_name} {reg_val}"):
-                                    score += 0.2
-
-            if score > 0:
-                scores[vuln_type] = min(score, 1.0)
+        for i, (vuln_type, rule) in enumerate(self._vuln_rules):
+            if i not in matched:
+                continue
+            score = totals.get(vuln_type, 0.0) + rule.weight
+
+            # Check register patterns if specified
+            if rule.register_patterns:
+                for reg_name, reg_val in data.get('registers', {}).items():
+                    for reg_pattern in rule.register_patterns:
+                        if reg_pattern.search(f"{reg_name} {reg_val}"):
+                            score += 0.2
+
+            totals[vuln_type] = score
+
+        scores = {vuln_type: min(score, 1.0) for vuln_type, score in totals.items() if score > 0}
 
         # Return highest scoring type
         if scores:
@@ -467,26 +849,25 @@ class EnhancedTriageEngine:
         """
         score = 0
         indicators = []
-        raw_text = (data.get('raw_output', '') + data.get('exception', '')).lower()
 
         # Check each exploitability indicator
-        for indicator_dict in self.exploit_indicators:
-            if re.search(indicator_dict['pattern'], raw_text, re.IGNORECASE):
-                score += indicator_dict['score']
-                indicators.append(indicator_dict['name'])
+        matched = self._pattern_hits(data)
+        for i, indicator in enumerate(self.exploit_indicators, self._exploit_offset):
+            if i in matched:
+                score += indicator.score
+                indicators.append(indicator.name)
 
         # Check register control
         regs = data.get('registers', {})
-        if any(reg in ['rip', 'eip', 'pc'] for reg in regs):
-            pc_val = regs.get('rip') or regs.get('eip') or regs.get('pc')
-            if pc_val:
-                # Check for pattern-based control
-                if '41414141' in pc_val or '42424242' in pc_val:
-                    score += 40
-                    indicators.append('Full PC Control (pattern-based)')
-                elif pc_val not in ['0x0', '0x00000000', '0x0000000000000000']:
-                    score += 20
-                    indicators.append('PC Control (non-null)')
+        pc_val = regs.get('rip') or regs.get('eip') or regs.get('pc')
+        if pc_val:
+            # Check for pattern-based control
+            if '41414141' in pc_val or '42424242' in pc_val:
+                score += 40
+                indicators.append('Full PC Control (pattern-based)')
+            elif pc_val not in ['0x0', '0x00000000', '0x0000000000000000']:
+                score += 20
+                indicators.append('PC Control (non-null)')
 
         # Cap at 100
         return min(score, 100), indicators
@@ -515,7 +896,7 @@ class EnhancedTriageEngine:
     def _detect_control_flow_hijack(self, data: Dict) -> bool:
         """Detect if crash allows control flow hijacking"""
         regs = data.get('registers', {})
-        raw_text = data.get('raw_output', '').lower()
+        raw_text = _lowered_text(data)
 
         # Check PC control
         if any(reg in ['rip', 'eip', 'pc'] for reg in regs):
@@ -526,58 +907,32 @@ class EnhancedTriageEngine:
             return True
 
         # Check indirect call/jump corruption
-        if re.search(r'call.*corrupt|jmp.*corrupt', raw_text):
+        if _BRANCH_CORRUPT_RE.search(raw_text):
             return True
 
         return False
 
     def _detect_memory_corruption(self, data: Dict) -> bool:
         """Detect memory corruption"""
-        raw_text = data.get('raw_output', '').lower()
-
-        corruption_indicators = [
-            'corrupt',
-            'overflow',
-            'overwrite',
-            'smash',
-            'invalid.*size',
-            'heap.*metadata',
-            'use after free'
-        ]
-
-        return any(re.search(pattern, raw_text) for pattern in corruption_indicators)
+        return bool(_CORRUPTION_RE.search(_lowered_text(data)))
 
     def _detect_controlled_data(self, data: Dict) -> bool:
         """Detect if attacker controls data"""
         regs = data.get('registers', {})
 
-        # Check for pattern-based values in registers
-        patterns = ['41414141', '42424242', '43434343', 'aaaaaaaa', 'bbbbbbbb']
-        for reg_val in regs.values():
-            if any(pattern in reg_val.lower() for pattern in patterns):
-                return True
-
-        return False
+        # One scan over all values; the newlines keep matches within a value
+        return _CTRL_DATA_RE.search('\n'.join(regs.values())) is not None
 
     def _detect_mitigations(self, data: Dict) -> List[str]:
         """Detect active security mitigations"""
-        mitigations = []
-        raw_text = data.get('raw_output', '')
-
-        # Common mitigations
-        if '__stack_chk_fail' in raw_text or 'stack canary' in raw_text.lower():
-            mitigations.append('Stack Canary')
-
-        if 'aslr' in raw_text.lower() or 'pie' in raw_text.lower():
-            mitigations.append('ASLR/PIE')
-
-        if 'dep' in raw_text.lower() or 'nx' in raw_text.lower():
-            mitigations.append('DEP/NX')
-
-        if 'cfi' in raw_text.lower() or 'control flow' in raw_text.lower():
-            mitigations.append('CFI')
+        found = set()
+        for match in _MITIGATION_RE.finditer(_lowered_text(data)):
+            found.add(match.lastgroup)
+            if len(found) == len(_MITIGATION_NAMES):
+                break
 
-        return mitigations
+        # Reported in a fixed order, whatever order they appear in
+        return [name for group, name in _MITIGATION_NAMES if group in found]
 
     def _analyze_root_cause(self, data: Dict, vuln_type: VulnType) -> Optional[str]:
         """Analyze likely root cause"""
@@ -608,11 +963,11 @@ class EnhancedTriageEngine:
     def _find_similar_cves(self, data: Dict, vuln_type: VulnType) -> List[str]:
         """Find similar known CVEs"""
         similar = []
-        raw_text = data.get('raw_output', '').lower()
+        matched = self._pattern_hits(data)
 
-        for cve_info in self.cve_patterns:
-            if re.search(cve_info['pattern'], raw_text):
-                similar.append(cve_info['cve'])
+        for i, cve_info in enumerate(self.cve_patterns, self._cve_offset):
+            if i in matched:
+                similar.append(cve_info.cve)
 
         return similar
 
@@ -8,288 +8,387 @@ Generates professional triage reports in multiple formats:
 - HTML reports (optional)
 """
 
+from __future__ import annotations
+
 import os
+import heapq
 import json
-from datetime import datetime
-from typing import List, Dict
+import threading
+from collections import Counter
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Dict, Optional, Set, Tuple
 from analysis.enhanced_triage import CrashAnalysis, Severity, VulnType
 
+# datetime is only needed once a report is generated (see _now); annotations
+# are strings under "from __future__ import annotations"
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Faster JSON encoding (optional - orjson)
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+# Text report recommendations by severity
+_SEVERITY_RECOMMENDATIONS = {
+    Severity.CRITICAL: (
+        "⚠️  CRITICAL: Immediate action required!\n"
+        "  1. Isolate affected systems\n"
+        "  2. Verify exploitability with POC\n"
+        "  3. Develop and test fix immediately\n"
+        "  4. Consider emergency patch release"
+    ),
+    Severity.HIGH: (
+        "⚠️  HIGH: Priority fix needed\n"
+        "  1. Reproduce crash reliably\n"
+        "  2. Analyze with debugger\n"
+        "  3. Develop fix for next release\n"
+        "  4. Add regression test"
+    ),
+    Severity.MEDIUM: (
+        "  1. Reproduce and document crash\n"
+        "  2. Schedule fix for upcoming release\n"
+        "  3. Add to bug tracker"
+    ),
+}
+_DEFAULT_RECOMMENDATION = (
+    "  1. Document crash for future reference\n"
+    "  2. Consider low-priority fix"
+)
+
+# Report formats in save order: name -> (file extension, chunk generator method)
+_REPORT_FORMATS = {
+    'text': ('.txt', '_iter_text_report'),
+    'json': ('.json', '_iter_json_report'),
+    'markdown': ('.md', '_iter_markdown_report'),
+}
+
+# Section banner rule and the opening banner of a text report
+_SEP = "=" * 80
+_HEADER_TEXT = _SEP + "\nFAWKES CRASH TRIAGE REPORT\n" + _SEP + "\n"
+
+# Summary report recommendations, filled in with the crash count; the
+# trailing newline leaves a blank line after each block
+_CRITICAL_BLOCK = (
+    "⚠️  CRITICAL: {n} critical vulnerabilities require immediate attention!\n"
+    "  → Review all critical crashes immediately\n"
+    "  → Develop patches and test thoroughly\n"
+    "  → Consider security advisory/CVE assignment\n"
+)
+_HIGH_BLOCK = (
+    "⚠️  HIGH: {n} high-severity vulnerabilities need priority fixes\n"
+    "  → Schedule fixes for next release cycle\n"
+    "  → Add regression tests\n"
+)
+
+# Summary report field accessors
+_SEVERITY_OF = attrgetter('severity')
+_VULN_TYPE_OF = attrgetter('vuln_type')
+_STACK_HASH_OF = attrgetter('stack_hash')
+_SCORE_OF = attrgetter('exploitability_score')
+
+# Markdown severity badges
+_SEVERITY_EMOJI = {
+    Severity.CRITICAL: "🔴",
+    Severity.HIGH: "🟠",
+    Severity.MEDIUM: "🟡",
+    Severity.LOW: "🟢",
+    Severity.INFO: "🔵"
+}
+
+
+# Report directories already created by this process, so that constructing
+# more generators for the same directory skips the makedirs stat
+_ensured_dirs: Set[str] = set()
+_ensured_dirs_lock = threading.Lock()
+
+
+def _now() -> datetime:
+    """Current local time, importing datetime on first use"""
+    from datetime import datetime
+    return datetime.now()
+
+
+def _write_report(path: str, report: str):
+    """Write a report as UTF-8 in one buffered binary write"""
+    with open(path, 'wb', buffering=65536) as f:
+        f.write(report.encode('utf-8'))
+
+
+def _write_chunks(path: str, chunks: Iterable[str]):
+    """Write a report as UTF-8 chunk by chunk, coalesced by a 64 KiB buffer"""
+    with open(path, 'wb', buffering=65536) as f:
+        f.writelines(chunk.encode('utf-8') for chunk in chunks)
+
+
+def _interleave_blank_lines(sections: Iterable[str]) -> Iterator[str]:
+    """Yield newline-terminated sections with a blank line between each"""
+    sections = iter(sections)
+    for section in sections:
+        yield section
+        break
+    for section in sections:
+        yield "\n"
+        yield section
+
+
+def _text_section(title: str, lines: List[str]) -> str:
+    """Text report section: banner, blank line, then one entry per line"""
+    return f"{_SEP}\n{title}\n{_SEP}\n\n" + "\n".join(lines) + "\n"
+
+
+def _markdown_section(title: str, lines: List[str]) -> str:
+    """Markdown report section: heading, blank line, then one entry per line"""
+    return f"## {title}\n\n" + "\n".join(lines) + "\n"
+
 
 class ReportGenerator:
     """Generate formatted crash reports"""
 
     def __init__(self, output_dir: str = "~/.fawkes/reports"):
         self.output_dir = os.path.expanduser(output_dir)
-        os.makedirs(self.output_dir, exist_ok=True)
-
-    def generate_text_report(self, analysis: CrashAnalysis) -> str:
-        """Generate detailed text report"""
-        lines = []
-        lines.append("=" * 80)
-        lines.append("FAWKES CRASH TRIAGE REPORT")
-        lines.append("=" * 80)
-        lines.append("")
-
-        # Header
-        lines.append(f"Crash ID: {analysis.crash_id}")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Signature: {analysis.signature}")
-        lines.append(f"Stack Hash: {analysis.stack_hash}")
-        lines.append("")
+        if self.output_dir not in _ensured_dirs:
+            with _ensured_dirs_lock:
+                os.makedirs(self.output_dir, exist_ok=True)
+                _ensured_dirs.add(self.output_dir)
+        # Report paths are this prefix plus "<stack hash>_<timestamp>.<ext>"
+        self._path_prefix = os.path.join(self.output_dir, "crash_report_")
+        self._executor = None  # report writer pool, started on first save (see _get_executor)
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def close(self):
+        """Wait for pending report writes and stop the writer threads"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Writer pool shared by every save_report and save_reports call"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4),
+                                                thread_name_prefix="fawkes-report")
+        return self._executor
+
+    def generate_text_report(self, analysis: CrashAnalysis, now: Optional[datetime] = None,
+                             sorted_regs: Optional[List[Tuple[str, str]]] = None) -> str:
+        """
+        Generate detailed text report, timestamped now (default: current time)
+
+        sorted_regs, if given, is sorted(analysis.registers.items()) computed
+        by the caller, e.g. once for several formats.
+        """
+        return "".join(self._iter_text_report(analysis, now or _now(), sorted_regs))
+
+    def _iter_text_report(self, analysis: CrashAnalysis, now: datetime,
+                          sorted_regs: Optional[List[Tuple[str, str]]] = None) -> Iterator[str]:
+        """Text report in chunks, a blank line between sections"""
+        return _interleave_blank_lines(self._text_sections(analysis, now, sorted_regs))
+
+    def _text_sections(self, analysis: CrashAnalysis, now: datetime,
+                       sorted_regs: Optional[List[Tuple[str, str]]]) -> Iterator[str]:
+        """Text report sections, each ending in a newline"""
+        yield _HEADER_TEXT + (
+            "\n"
+            f"Crash ID: {analysis.crash_id}\n"
+            f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"Signature: {analysis.signature}\n"
+            f"Stack Hash: {analysis.stack_hash}\n"
+        )
 
         # Severity and Exploitability
-        lines.append("=" * 80)
-        lines.append("SEVERITY ASSESSMENT")
-        lines.append("=" * 80)
-        lines.append("")
-        lines.append(f"Severity: {analysis.severity.value}")
-        lines.append(f"Exploitability Score: {analysis.exploitability_score}/100")
-        lines.append(f"Confidence: {analysis.confidence * 100:.1f}%")
-        lines.append("")
+        yield (
+            f"{_SEP}\n"
+            "SEVERITY ASSESSMENT\n"
+            f"{_SEP}\n"
+            "\n"
+            f"Severity: {analysis.severity.value}\n"
+            f"Exploitability Score: {analysis.exploitability_score}/100\n"
+            f"Confidence: {analysis.confidence * 100:.1f}%\n"
+        )
 
         # Vulnerability Classification
-        lines.append("=" * 80)
-        lines.append("VULNERABILITY CLASSIFICATION")
-        lines.append("=" * 80)
-        lines.append("")
-        lines.append(f"Type: {analysis.vuln_type.value}")
-        lines.append(f"Class: {analysis.vuln_class}")
-        lines.append(f"Control Flow Hijack: {'YES' if analysis.control_flow_hijack else 'NO'}")
-        lines.append(f"Memory Corruption: {'YES' if analysis.memory_corruption else 'NO'}")
-        lines.append(f"Controlled Data: {'YES' if analysis.controlled_data else 'NO'}")
-        lines.append("")
+        yield (
+            f"{_SEP}\n"
+            "VULNERABILITY CLASSIFICATION\n"
+            f"{_SEP}\n"
+            "\n"
+            f"Type: {analysis.vuln_type.value}\n"
+            f"Class: {analysis.vuln_class}\n"
+            f"Control Flow Hijack: {'YES' if analysis.control_flow_hijack else 'NO'}\n"
+            f"Memory Corruption: {'YES' if analysis.memory_corruption else 'NO'}\n"
+            f"Controlled Data: {'YES' if analysis.controlled_data else 'NO'}\n"
+        )
 
         # Exploit Indicators
         if analysis.indicators:
-            lines.append("=" * 80)
-            lines.append("EXPLOIT INDICATORS")
-            lines.append("=" * 80)
-            lines.append("")
-            for indicator in analysis.indicators:
-                lines.append(f"  • {indicator}")
-            lines.append("")
+            yield _text_section("EXPLOIT INDICATORS", [f"  • {indicator}" for indicator in analysis.indicators])
 
         # Stack Trace
         if analysis.stack_frames:
-            lines.append("=" * 80)
-            lines.append("STACK TRACE")
-            lines.append("=" * 80)
-            lines.append("")
-            for i, frame in enumerate(analysis.stack_frames):
-                lines.append(f"  #{i}: {frame}")
-            lines.append("")
+            yield _text_section("STACK TRACE", [f"  #{i}: {frame}" for i, frame in enumerate(analysis.stack_frames)])
 
         # Registers
         if analysis.registers:
-            lines.append("=" * 80)
-            lines.append("REGISTERS")
-            lines.append("=" * 80)
-            lines.append("")
-            for reg, val in sorted(analysis.registers.items()):
-                lines.append(f"  {reg:8s} = {val}")
-            lines.append("")
+            if sorted_regs is None:
+                sorted_regs = sorted(analysis.registers.items())
+            yield _text_section("REGISTERS", [f"  {reg:8s} = {val}" for reg, val in sorted_regs])
 
         # Crash Details
-        lines.append("=" * 80)
-        lines.append("CRASH DETAILS")
-        lines.append("=" * 80)
-        lines.append("")
+        details = ""
         if analysis.fault_address:
-            lines.append(f"Fault Address: {analysis.fault_address}")
+            details += f"Fault Address: {analysis.fault_address}\n"
         if analysis.crash_instruction:
-            lines.append(f"Crash Instruction: {analysis.crash_instruction}")
-        lines.append("")
+            details += f"Crash Instruction: {analysis.crash_instruction}\n"
+        yield f"{_SEP}\nCRASH DETAILS\n{_SEP}\n\n{details}"
 
         # Security Mitigations
         if analysis.mitigations:
-            lines.append("=" * 80)
-            lines.append("ACTIVE MITIGATIONS")
-            lines.append("=" * 80)
-            lines.append("")
-            for mitigation in analysis.mitigations:
-                lines.append(f"  ✓ {mitigation}")
-            lines.append("")
+            yield _text_section("ACTIVE MITIGATIONS", [f"  ✓ {mitigation}" for mitigation in analysis.mitigations])
 
         # Root Cause Analysis
         if analysis.root_cause:
-            lines.append("=" * 80)
-            lines.append("ROOT CAUSE ANALYSIS")
-            lines.append("=" * 80)
-            lines.append("")
-            lines.append(analysis.root_cause)
-            lines.append("")
+            yield _text_section("ROOT CAUSE ANALYSIS", [analysis.root_cause])
 
         # Suggested Fix
         if analysis.suggested_fix:
-            lines.append("=" * 80)
-            lines.append("SUGGESTED FIX")
-            lines.append("=" * 80)
-            lines.append("")
-            lines.append(analysis.suggested_fix)
-            lines.append("")
+            yield _text_section("SUGGESTED FIX", [analysis.suggested_fix])
 
         # Similar CVEs
         if analysis.similar_cves:
-            lines.append("=" * 80)
-            lines.append("SIMILAR KNOWN VULNERABILITIES")
-            lines.append("=" * 80)
-            lines.append("")
-            for cve in analysis.similar_cves:
-                lines.append(f"  • {cve}")
-            lines.append("")
+            yield _text_section("SIMILAR KNOWN VULNERABILITIES", [f"  • {cve}" for cve in analysis.similar_cves])
 
         # Triage Notes
         if analysis.triage_notes:
-            lines.append("=" * 80)
-            lines.append("TRIAGE NOTES")
-            lines.append("=" * 80)
-            lines.append("")
-            for note in analysis.triage_notes:
-                lines.append(f"  • {note}")
-            lines.append("")
+            yield _text_section("TRIAGE NOTES", [f"  • {note}" for note in analysis.triage_notes])
 
         # Recommendations
-        lines.append("=" * 80)
-        lines.append("RECOMMENDATIONS")
-        lines.append("=" * 80)
-        lines.append("")
-
-        if analysis.severity == Severity.CRITICAL:
-            lines.append("⚠️  CRITICAL: Immediate action required!")
-            lines.append("  1. Isolate affected systems")
-            lines.append("  2. Verify exploitability with POC")
-            lines.append("  3. Develop and test fix immediately")
-            lines.append("  4. Consider emergency patch release")
-        elif analysis.severity == Severity.HIGH:
-            lines.append("⚠️  HIGH: Priority fix needed")
-            lines.append("  1. Reproduce crash reliably")
-            lines.append("  2. Analyze with debugger")
-            lines.append("  3. Develop fix for next release")
-            lines.append("  4. Add regression test")
-        elif analysis.severity == Severity.MEDIUM:
-            lines.append("  1. Reproduce and document crash")
-            lines.append("  2. Schedule fix for upcoming release")
-            lines.append("  3. Add to bug tracker")
-        else:
-            lines.append("  1. Document crash for future reference")
-            lines.append("  2. Consider low-priority fix")
-
-        lines.append("")
-        lines.append("=" * 80)
-        lines.append("END OF REPORT")
-        lines.append("=" * 80)
-
-        return "\n".join(lines)
-
-    def generate_json_report(self, analysis: CrashAnalysis) -> str:
-        """Generate machine-readable JSON report"""
+        recommendations = _SEVERITY_RECOMMENDATIONS.get(analysis.severity, _DEFAULT_RECOMMENDATION)
+        yield _text_section("RECOMMENDATIONS", [recommendations])
+
+        yield f"{_SEP}\nEND OF REPORT\n{_SEP}"
+
+    def generate_json_report(self, analysis: CrashAnalysis, now: Optional[datetime] = None,
+                             analysis_dict: Optional[Dict] = None) -> str:
+        """
+        Generate machine-readable JSON report, timestamped now (default: current time)
+
+        analysis_dict, if given, is used in place of analysis.to_dict().
+        """
+        if now is None:
+            now = _now()
         report = {
-            'generated': datetime.now().isoformat(),
-            'crash_analysis': analysis.to_dict(),
+            'generated': now.isoformat(),
+            'crash_analysis': analysis_dict if analysis_dict is not None else analysis.to_dict(),
             'metadata': {
                 'generator': 'Fawkes Enhanced Triage',
                 'version': '0.2.0'
             }
         }
+        if HAS_ORJSON:
+            try:
+                return orjson.dumps(report, option=orjson.OPT_INDENT_2).decode('utf-8')
+            except TypeError:
+                pass  # e.g. register values orjson cannot encode; json.dumps decides
         return json.dumps(report, indent=2)
 
-    def generate_markdown_report(self, analysis: CrashAnalysis) -> str:
-        """Generate Markdown report for documentation"""
-        lines = []
+    def _iter_json_report(self, analysis: CrashAnalysis, now: datetime,
+                          sorted_regs: Optional[List[Tuple[str, str]]] = None) -> Iterator[str]:
+        """JSON report as a single chunk (the encoders build it whole); sorted_regs is unused"""
+        yield self.generate_json_report(analysis, now)
 
-        # Header
-        lines.append(f"# Crash Report: {analysis.crash_id}")
-        lines.append("")
-        lines.append(f"**Generated**: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"**Signature**: `{analysis.signature}`")
-        lines.append(f"**Stack Hash**: `{analysis.stack_hash}`")
-        lines.append("")
+    def generate_markdown_report(self, analysis: CrashAnalysis, now: Optional[datetime] = None,
+                                 sorted_regs: Optional[List[Tuple[str, str]]] = None) -> str:
+        """
+        Generate Markdown report for documentation, timestamped now (default: current time)
 
-        # Severity Badge
-        severity_emoji = {
-            Severity.CRITICAL: "🔴",
-            Severity.HIGH: "🟠",
-            Severity.MEDIUM: "🟡",
-            Severity.LOW: "🟢",
-            Severity.INFO: "🔵"
-        }
-        emoji = severity_emoji.get(analysis.severity, "⚪")
+        sorted_regs is as for generate_text_report.
+        """
+        return "".join(self._iter_markdown_report(analysis, now or _now(), sorted_regs))
 
-        lines.append(f"## {emoji} Severity: {analysis.severity.value}")
-        lines.append("")
-        lines.append(f"- **Exploitability Score**: {analysis.exploitability_score}/100")
-        lines.append(f"- **Confidence**: {analysis.confidence * 100:.1f}%")
-        lines.append("")
+    def _iter_markdown_report(self, analysis: CrashAnalysis, now: datetime,
+                              sorted_regs: Optional[List[Tuple[str, str]]] = None) -> Iterator[str]:
+        """Markdown report in chunks, a blank line between sections"""
+        return _interleave_blank_lines(self._markdown_sections(analysis, now, sorted_regs))
+
+    def _markdown_sections(self, analysis: CrashAnalysis, now: datetime,
+                           sorted_regs: Optional[List[Tuple[str, str]]]) -> Iterator[str]:
+        """Markdown report sections, each ending in a newline"""
+        # Severity Badge
+        emoji = _SEVERITY_EMOJI.get(analysis.severity, "⚪")
+
+        yield (
+            f"# Crash Report: {analysis.crash_id}\n"
+            "\n"
+            f"**Generated**: {now.strftime('%Y-%m-%d %H:%M:%S')}\n"
+            f"**Signature**: `{analysis.signature}`\n"
+            f"**Stack Hash**: `{analysis.stack_hash}`\n"
+        )
+
+        yield (
+            f"## {emoji} Severity: {analysis.severity.value}\n"
+            "\n"
+            f"- **Exploitability Score**: {analysis.exploitability_score}/100\n"
+            f"- **Confidence**: {analysis.confidence * 100:.1f}%\n"
+        )
 
         # Vulnerability Info
-        lines.append("## 🐛 Vulnerability")
-        lines.append("")
-        lines.append(f"- **Type**: {analysis.vuln_type.value}")
-        lines.append(f"- **Class**: {analysis.vuln_class}")
-        lines.append(f"- **Control Flow Hijack**: {' ✅' if analysis.control_flow_hijack else '❌'}")
-        lines.append(f"- **Memory Corruption**: {'✅' if analysis.memory_corruption else '❌'}")
-        lines.append(f"- **Controlled Data**: {'✅' if analysis.controlled_data else '❌'}")
-        lines.append("")
+        yield (
+            "## 🐛 Vulnerability\n"
+            "\n"
+            f"- **Type**: {analysis.vuln_type.value}\n"
+            f"- **Class**: {analysis.vuln_class}\n"
+            f"- **Control Flow Hijack**: {' ✅' if analysis.control_flow_hijack else '❌'}\n"
+            f"- **Memory Corruption**: {'✅' if analysis.memory_corruption else '❌'}\n"
+            f"- **Controlled Data**: {'✅' if analysis.controlled_data else '❌'}\n"
+        )
 
         # Indicators
         if analysis.indicators:
-            lines.append("## ⚠️ Exploit Indicators")
-            lines.append("")
-            for indicator in analysis.indicators:
-                lines.append(f"- {indicator}")
-            lines.append("")
+            yield _markdown_section("⚠️ Exploit Indicators", [f"- {indicator}" for indicator in analysis.indicators])
 
         # Stack Trace
         if analysis.stack_frames:
-            lines.append("## 📋 Stack Trace")
-            lines.append("")
-            lines.append("```")
-            for i, frame in enumerate(analysis.stack_frames):
-                lines.append(f"#{i}: {frame}")
-            lines.append("```")
-            lines.append("")
+            yield _markdown_section(
+                "📋 Stack Trace",
+                ["```"] + [f"#{i}: {frame}" for i, frame in enumerate(analysis.stack_frames)] + ["```"]
+            )
 
         # Registers
         if analysis.registers:
-            lines.append("## 🔧 Registers")
-            lines.append("")
-            lines.append("```")
-            for reg, val in sorted(analysis.registers.items()):
-                lines.append(f"{reg:8s} = {val}")
-            lines.append("```")
-            lines.append("")
+            if sorted_regs is None:
+                sorted_regs = sorted(analysis.registers.items())
+            yield _markdown_section(
+                "🔧 Registers",
+                ["```"] + [f"{reg:8s} = {val}" for reg, val in sorted_regs] + ["```"]
+            )
 
         # Root Cause
         if analysis.root_cause:
-            lines.append("## 🔍 Root Cause")
-            lines.append("")
-            lines.append(analysis.root_cause)
-            lines.append("")
+            yield _markdown_section("🔍 Root Cause", [analysis.root_cause])
 
         # Fix Suggestion
         if analysis.suggested_fix:
-            lines.append("## 🛠️ Suggested Fix")
-            lines.append("")
-            lines.append(analysis.suggested_fix)
-            lines.append("")
+            yield _markdown_section("🛠️ Suggested Fix", [analysis.suggested_fix])
 
         # Similar CVEs
         if analysis.similar_cves:
-            lines.append("## 🔗 Similar CVEs")
-            lines.append("")
-            for cve in analysis.similar_cves:
-                lines.append(f"- {cve}")
-            lines.append("")
+            yield _markdown_section("🔗 Similar CVEs", [f"- {cve}" for cve in analysis.similar_cves])
 
         # Mitigations
         if analysis.mitigations:
-            lines.append("## 🛡️ Active Mitigations")
-            lines.append("")
-            for mitigation in analysis.mitigations:
-                lines.append(f"- ✅ {mitigation}")
-            lines.append("")
-
-        return "\n".join(lines)
+            yield _markdown_section("🛡️ Active Mitigations", [f"- ✅ {mitigation}" for mitigation in analysis.mitigations])
 
     def save_report(self, analysis: CrashAnalysis, formats: List[str] = None) -> Dict[str, str]:
         """
@@ -306,28 +405,76 @@ class ReportGenerator:
             formats = ['text', 'json', 'markdown']
 
         saved_files = {}
-        base_name = f"crash_report_{analysis.stack_hash}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-
-        if 'text' in formats:
-            text_path = os.path.join(self.output_dir, f"{base_name}.txt")
-            with open(text_path, 'w') as f:
-                f.write(self.generate_text_report(analysis))
-            saved_files['text'] = text_path
-
-        if 'json' in formats:
-            json_path = os.path.join(self.output_dir, f"{base_name}.json")
-            with open(json_path, 'w') as f:
-                f.write(self.generate_json_report(analysis))
-            saved_files['json'] = json_path
-
-        if 'markdown' in formats:
-            md_path = os.path.join(self.output_dir, f"{base_name}.md")
-            with open(md_path, 'w') as f:
-                f.write(self.generate_markdown_report(analysis))
-            saved_files['markdown'] = md_path
+        # One timestamp for the file names and every format's contents
+        now = _now()
+
+        # Each format is generated and written on its own thread, so the writes overlap
+        executor = self._get_executor()
+        futures = []
+        for fmt, path, produce in self._report_jobs(analysis, formats, now):
+            futures.append((fmt, path, executor.submit(self._write_one, path, produce)))
+        for fmt, path, future in futures:
+            future.result()
+            saved_files[fmt] = path
 
         return saved_files
 
+    def save_reports(self, analyses: List[CrashAnalysis], formats: List[str] = None) -> Dict[str, Dict[str, str]]:
+        """
+        Save reports for a batch of crashes
+
+        Every (crash, format) report is generated and written on the shared
+        writer pool, so writes overlap across crashes as well as formats.
+
+        Args:
+            analyses: CrashAnalysis objects
+            formats: List of formats ('text', 'json', 'markdown'). Default: all
+
+        Returns:
+            Dict mapping crash ID to a dict of format to saved file path
+        """
+        if formats is None:
+            formats = ['text', 'json', 'markdown']
+
+        saved = {}
+        writes = {}
+        now = _now()
+        for analysis in analyses:
+            files = saved.setdefault(analysis.crash_id, {})
+            for fmt, path, produce in self._report_jobs(analysis, formats, now):
+                # Crashes with the same stack hash share file names; as with
+                # sequential save_report calls, the last one saved wins
+                writes[path] = produce
+                files[fmt] = path
+
+        if writes:
+            executor = self._get_executor()
+            futures = [executor.submit(self._write_one, path, produce) for path, produce in writes.items()]
+            for future in futures:
+                future.result()
+
+        return saved
+
+    def _report_jobs(self, analysis: CrashAnalysis, formats: List[str],
+                     now: datetime) -> List[Tuple[str, str, Callable[[], Iterable[str]]]]:
+        """(format, path, chunk producer) for each requested format of one report"""
+        base_path = f"{self._path_prefix}{analysis.stack_hash}_{now.strftime('%Y%m%d_%H%M%S')}"
+        # Sorted once for both the text and markdown formats
+        sorted_regs = None
+        if analysis.registers and ('text' in formats or 'markdown' in formats):
+            sorted_regs = sorted(analysis.registers.items())
+        # Nothing is generated here: each producer runs inside its write job
+        return [
+            (fmt, base_path + ext, partial(getattr(self, method), analysis, now, sorted_regs))
+            for fmt, (ext, method) in _REPORT_FORMATS.items()
+            if fmt in formats
+        ]
+
+    @staticmethod
+    def _write_one(path: str, produce: Callable[[], Iterable[str]]):
+        """Generate one report format and stream it to path as it is built"""
+        _write_chunks(path, produce())
+
 
 def generate_summary_report(analyses: List[CrashAnalysis], output_path: str = None) -> str:
     """
@@ -340,97 +487,91 @@ def generate_summary_report(analyses: List[CrashAnalysis], output_path: str = No
     Returns:
         Summary report text
     """
+    # Every aggregate is one C-level pass (map/attrgetter into Counter, set
+    # and nlargest), with no interpreted bytecode per crash. nlargest keeps
+    # input order among equal scores, like a stable sort.
+    severity_counts = Counter(map(_SEVERITY_OF, analyses))
+    vuln_counts = Counter(map(_VULN_TYPE_OF, analyses))
+    unique_hashes = set(map(_STACK_HASH_OF, analyses))
+    sorted_analyses = heapq.nlargest(10, analyses, key=_SCORE_OF)
+
+    # Percentages multiply by this; an empty batch reports 0.0% throughout
+    inv_n_100 = 100.0 / len(analyses) if analyses else 0.0
+
     lines = []
-    lines.append("=" * 80)
-    lines.append("FAWKES CRASH SUMMARY REPORT")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    lines.append(f"Total Crashes Analyzed: {len(analyses)}")
-    lines.append("")
+    lines_append = lines.append
+    lines_append(_SEP)
+    lines_append("FAWKES CRASH SUMMARY REPORT")
+    lines_append(_SEP)
+    lines_append("")
+    lines_append(f"Generated: {_now().strftime('%Y-%m-%d %H:%M:%S')}")
+    lines_append(f"Total Crashes Analyzed: {len(analyses)}")
+    lines_append("")
 
     # Severity breakdown
-    severity_counts = {}
-    for analysis in analyses:
-        severity_counts[analysis.severity] = severity_counts.get(analysis.severity, 0) + 1
-
-    lines.append("=" * 80)
-    lines.append("SEVERITY BREAKDOWN")
-    lines.append("=" * 80)
-    lines.append("")
+    lines_append(_SEP)
+    lines_append("SEVERITY BREAKDOWN")
+    lines_append(_SEP)
+    lines_append("")
     for severity in [Severity.CRITICAL, Severity.HIGH, Severity.MEDIUM, Severity.LOW, Severity.INFO]:
         count = severity_counts.get(severity, 0)
         if count > 0:
-            percentage = (count / len(analyses)) * 100
-            lines.append(f"  {severity.value:12s}: {count:3d} ({percentage:5.1f}%)")
-    lines.append("")
+            percentage = count * inv_n_100
+            lines_append(f"  {severity.value:12s}: {count:3d} ({percentage:5.1f}%)")
+    lines_append("")
 
     # Vulnerability type breakdown
-    vuln_counts = {}
-    for analysis in analyses:
-        vuln_counts[analysis.vuln_type] = vuln_counts.get(analysis.vuln_type, 0) + 1
-
-    lines.append("=" * 80)
-    lines.append("VULNERABILITY TYPES")
-    lines.append("=" * 80)
-    lines.append("")
+    lines_append(_SEP)
+    lines_append("VULNERABILITY TYPES")
+    lines_append(_SEP)
+    lines_append("")
     for vuln_type, count in sorted(vuln_counts.items(), key=lambda x: x[1], reverse=True):
-        percentage = (count / len(analyses)) * 100
-        lines.append(f"  {vuln_type.value:30s}: {count:3d} ({percentage:5.1f}%)")
-    lines.append("")
+        percentage = count * inv_n_100
+        lines_append(f"  {vuln_type.value:30s}: {count:3d} ({percentage:5.1f}%)")
+    lines_append("")
 
     # Top crashes by exploitability
-    lines.append("=" * 80)
-    lines.append("TOP 10 MOST EXPLOITABLE CRASHES")
-    lines.append("=" * 80)
-    lines.append("")
-    sorted_analyses = sorted(analyses, key=lambda x: x.exploitability_score, reverse=True)[:10]
+    lines_append(_SEP)
+    lines_append("TOP 10 MOST EXPLOITABLE CRASHES")
+    lines_append(_SEP)
+    lines_append("")
     for i, analysis in enumerate(sorted_analyses, 1):
-        lines.append(f"  {i:2d}. {analysis.crash_id}")
-        lines.append(f"      Score: {analysis.exploitability_score}/100 | {analysis.severity.value} | {analysis.vuln_type.value}")
-        lines.append("")
+        lines_append(f"  {i:2d}. {analysis.crash_id}")
+        lines_append(f"      Score: {analysis.exploitability_score}/100 | {analysis.severity.value} | {analysis.vuln_type.value}")
+        lines_append("")
 
     # Unique crashes (by stack hash)
-    unique_hashes = set(a.stack_hash for a in analyses)
-    lines.append("=" * 80)
-    lines.append("DEDUPLICATION RESULTS")
-    lines.append("=" * 80)
-    lines.append("")
-    lines.append(f"  Total Crashes: {len(analyses)}")
-    lines.append(f"  Unique Crashes: {len(unique_hashes)}")
-    lines.append(f"  Duplicate Rate: {((len(analyses) - len(unique_hashes)) / len(analyses) * 100):.1f}%")
-    lines.append("")
+    lines_append(_SEP)
+    lines_append("DEDUPLICATION RESULTS")
+    lines_append(_SEP)
+    lines_append("")
+    lines_append(f"  Total Crashes: {len(analyses)}")
+    lines_append(f"  Unique Crashes: {len(unique_hashes)}")
+    lines_append(f"  Duplicate Rate: {(len(analyses) - len(unique_hashes)) * inv_n_100:.1f}%")
+    lines_append("")
 
     # Recommendations
     critical_count = severity_counts.get(Severity.CRITICAL, 0)
     high_count = severity_counts.get(Severity.HIGH, 0)
 
-    lines.append("=" * 80)
-    lines.append("RECOMMENDATIONS")
-    lines.append("=" * 80)
-    lines.append("")
+    lines_append(_SEP)
+    lines_append("RECOMMENDATIONS")
+    lines_append(_SEP)
+    lines_append("")
 
     if critical_count > 0:
-        lines.append(f"⚠️  CRITICAL: {critical_count} critical vulnerabilities require immediate attention!")
-        lines.append("  → Review all critical crashes immediately")
-        lines.append("  → Develop patches and test thoroughly")
-        lines.append("  → Consider security advisory/CVE assignment")
-        lines.append("")
+        lines_append(_CRITICAL_BLOCK.format(n=critical_count))
 
     if high_count > 0:
-        lines.append(f"⚠️  HIGH: {high_count} high-severity vulnerabilities need priority fixes")
-        lines.append("  → Schedule fixes for next release cycle")
-        lines.append("  → Add regression tests")
-        lines.append("")
+        lines_append(_HIGH_BLOCK.format(n=high_count))
 
-    lines.append("=" * 80)
-    lines.append("END OF SUMMARY")
-    lines.append("=" * 80)
+    lines_append(_SEP)
+    lines_append("END OF SUMMARY")
+    lines_append(_SEP)
 
     report_text = "\n".join(lines)
 
     if output_path:
-        with open(output_path, 'w') as f:
-            f.write(report_text)
+        _write_report(output_path, report_text)
 
     return report_text
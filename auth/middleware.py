@@ -6,11 +6,34 @@ Handles authentication and authorization for Fawkes network communication.
 
 import json
 import logging
-from typing import Dict, Any, Optional, Callable
+import sys
+from typing import Dict, Any, Iterable, NamedTuple, Optional, Callable
 from functools import wraps
 
 logger = logging.getLogger("fawkes.auth")
 
+# auth_type values, interned so table lookups on them match by identity
+AUTH_API_KEY = sys.intern("api_key")
+AUTH_SESSION_TOKEN = sys.intern("session_token")
+
+
+class _AuthHandler(NamedTuple):
+    """How one auth_type is carried in a message and validated"""
+    credential_field: str  # Message key holding the credential
+    validator: str  # AuthDB method that resolves the credential to a principal
+    principal_field: str  # Principal key naming who authenticated
+    missing_error: str
+    invalid_error: str
+    log_label: str
+
+
+_AUTH_HANDLERS: Dict[str, _AuthHandler] = {
+    AUTH_API_KEY: _AuthHandler("api_key", "validate_api_key", "key_name",
+                               "API key missing", "Invalid or expired API key", "API key"),
+    AUTH_SESSION_TOKEN: _AuthHandler("session_token", "validate_session", "username",
+                                     "Session token missing", "Invalid or expired session token", "user session"),
+}
+
 
 class AuthenticationError(Exception):
     """Raised when authentication fails"""
@@ -22,13 +45,29 @@ class AuthorizationError(Exception):
     pass
 
 
-def authenticate_request(auth_db, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+def bind_validators(auth_db: Any) -> Dict[str, Callable]:
+    """
+    Resolve the AuthDB validator for every auth type to a bound method
+
+    Args:
+        auth_db: AuthDB instance
+
+    Returns:
+        Dict mapping auth_type to its validator, for authenticate_request
+    """
+    return {auth_type: getattr(auth_db, handler.validator)
+            for auth_type, handler in _AUTH_HANDLERS.items()}
+
+
+def authenticate_request(auth_db: Any, message: Dict[str, Any],
+                         validators: Optional[Dict[str, Callable]] = None) -> Dict[str, Any]:
     """
     Authenticate a network request
 
     Args:
         auth_db: AuthDB instance
         message: Request message with authentication credentials
+        validators: Optional validators from bind_validators(auth_db)
 
     Returns:
         Dict with authenticated principal (user or API key info)
@@ -36,37 +75,30 @@ def authenticate_request(auth_db, message: Dict[str, Any]) -> Optional[Dict[str,
     Raises:
         AuthenticationError: If authentication fails
     """
-    auth_type = message.get("auth_type")
+    get = message.get
+    auth_type = get("auth_type")
 
     if not auth_type:
         raise AuthenticationError("No authentication provided")
 
-    if auth_type == "api_key":
-        api_key = message.get("api_key")
-        if not api_key:
-            raise AuthenticationError("API key missing")
-
-        principal = auth_db.validate_api_key(api_key)
-        if not principal:
-            raise AuthenticationError("Invalid or expired API key")
-
-        logger.debug(f"Authenticated API key: {principal['key_name']}")
-        return principal
-
-    elif auth_type == "session_token":
-        token = message.get("session_token")
-        if not token:
-            raise AuthenticationError("Session token missing")
-
-        principal = auth_db.validate_session(token)
-        if not principal:
-            raise AuthenticationError("Invalid or expired session token")
+    # Decoded JSON may carry an unhashable auth_type; treat it as unknown
+    handler = _AUTH_HANDLERS.get(auth_type) if isinstance(auth_type, str) else None
+    if handler is None:
+        raise AuthenticationError(f"Unknown authentication type: {auth_type}")
 
-        logger.debug(f"Authenticated user session: {principal['username']}")
-        return principal
+    credential = get(handler.credential_field)
+    if not credential:
+        raise AuthenticationError(handler.missing_error)
 
+    if validators is not None:
+        principal = validators[auth_type](credential)
     else:
-        raise AuthenticationError(f"Unknown authentication type: {auth_type}")
+        principal = getattr(auth_db, handler.validator)(credential)
+    if not principal:
+        raise AuthenticationError(handler.invalid_error)
+
+    logger.debug("Authenticated %s: %s", handler.log_label, principal[handler.principal_field])
+    return principal
 
 
 def require_permission(principal: Dict[str, Any], permission: str) -> bool:
@@ -83,21 +115,26 @@ def require_permission(principal: Dict[str, Any], permission: str) -> bool:
     Raises:
         AuthorizationError: If permission denied
     """
-    permissions = principal.get("permissions", [])
+    permissions = principal.get("permissions", ())
 
     if permission not in permissions:
-        logger.warning(f"Permission denied: {permission} for {principal.get('key_name') or principal.get('username')}")
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning("Permission denied: %s for %s", permission,
+                           principal.get("key_name") or principal.get("username"))
         raise AuthorizationError(f"Permission denied: {permission}")
 
     return True
 
 
-def authenticated(auth_db_getter: Callable):
+def authenticated(auth_db_getter: Callable[[], Any], lazy: bool = True) -> Callable[[Callable], Callable]:
     """
     Decorator for functions that require authentication
 
     Args:
         auth_db_getter: Function that returns AuthDB instance
+        lazy: Call auth_db_getter on every request. With lazy=False it is
+            called once when the function is decorated, and its validators
+            are bound up front.
 
     Example:
         @authenticated(lambda: get_auth_db())
@@ -105,21 +142,32 @@ def authenticated(auth_db_getter: Callable):
             # principal is automatically injected
             pass
     """
-    def decorator(func):
+    def decorator(func: Callable) -> Callable:
+        auth_db = None if lazy else auth_db_getter()
+        validators = None if lazy else bind_validators(auth_db)
+
         @wraps(func)
         def wrapper(message, *args, **kwargs):
-            auth_db = auth_db_getter()
             try:
-                principal = authenticate_request(auth_db, message)
+                if lazy:
+                    principal = authenticate_request(auth_db_getter(), message)
+                else:
+                    principal = authenticate_request(auth_db, message, validators)
                 return func(message, principal=principal, *args, **kwargs)
             except AuthenticationError as e:
-                logger.error(f"Authentication failed: {e}")
+                logger.error("Authentication failed: %s", e)
                 raise
         return wrapper
     return decorator
 
 
-def authorized(*required_permissions):
+def _deny_missing(principal: Dict[str, Any], required_permissions: Iterable[str]) -> None:
+    """Raise AuthorizationError for the first required permission the principal lacks"""
+    for permission in required_permissions:
+        require_permission(principal, permission)
+
+
+def authorized(*required_permissions: str) -> Callable[[Callable], Callable]:
     """
     Decorator for functions that require specific permissions
 
@@ -132,20 +180,65 @@ def authorized(*required_permissions):
         def handle_job_request(message, principal):
             pass
     """
-    def decorator(func):
+    required = frozenset(required_permissions)
+
+    def decorator(func: Callable) -> Callable:
         @wraps(func)
         def wrapper(*args, principal=None, **kwargs):
             if principal is None:
                 raise AuthorizationError("No authenticated principal")
 
-            for permission in required_permissions:
-                require_permission(principal, permission)
+            if not required.issubset(principal.get("permissions", ())):
+                _deny_missing(principal, required_permissions)
 
             return func(*args, principal=principal, **kwargs)
         return wrapper
     return decorator
 
 
+def require_auth(auth_db_getter: Callable[[], Any],
+                 *required_permissions: str) -> Callable[[Callable], Callable]:
+    """
+    Decorator combining @authenticated and @authorized in one wrapper
+
+    The AuthDB is fetched from auth_db_getter on the first request and
+    reused for every request after that.
+
+    Args:
+        auth_db_getter: Function that returns AuthDB instance
+        *required_permissions: Required permissions
+
+    Example:
+        @require_auth(lambda: get_auth_db(), "job:create", "worker:update")
+        def handle_job_request(message, principal):
+            pass
+    """
+    required = frozenset(required_permissions)
+
+    def decorator(func: Callable) -> Callable:
+        auth_db: Any = None
+        validators: Optional[Dict[str, Callable]] = None
+
+        @wraps(func)
+        def wrapper(message, *args, **kwargs):
+            nonlocal auth_db, validators
+            if validators is None:
+                auth_db = auth_db_getter()
+                validators = bind_validators(auth_db)
+            try:
+                principal = authenticate_request(auth_db, message, validators)
+            except AuthenticationError as e:
+                logger.error("Authentication failed: %s", e)
+                raise
+
+            if not required.issubset(principal.get("permissions", ())):
+                _deny_missing(principal, required_permissions)
+
+            return func(message, *args, principal=principal, **kwargs)
+        return wrapper
+    return decorator
+
+
 def add_authentication(message: Dict[str, Any], auth_type: str,
                       credential: str) -> Dict[str, Any]:
     """
@@ -153,21 +246,18 @@ def add_authentication(message: Dict[str, Any], auth_type: str,
 
     Args:
         message: Message dict
-        auth_type: Type of authentication ("api_key" or "session_token")
+        auth_type: Type of authentication (AUTH_API_KEY or AUTH_SESSION_TOKEN)
         credential: API key or session token
 
     Returns:
         Message with authentication added
     """
-    message["auth_type"] = auth_type
-
-    if auth_type == "api_key":
-        message["api_key"] = credential
-    elif auth_type == "session_token":
-        message["session_token"] = credential
-    else:
+    handler = _AUTH_HANDLERS.get(auth_type)
+    if handler is None:
         raise ValueError(f"Unknown auth type: {auth_type}")
 
+    message["auth_type"] = auth_type
+    message[handler.credential_field] = credential
     return message
 
 
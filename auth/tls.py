@@ -7,13 +7,88 @@ Provides encrypted communication for controller-worker connections.
 import ssl
 import socket
 import os
+import asyncio
 import logging
+import threading
+import time
+import weakref
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
-from datetime import datetime, timedelta
+from typing import Dict, Optional, Set, Tuple
+from datetime import datetime, timedelta, timezone
+
+# Certificate generation and parsing (optional - cryptography)
+try:
+    from cryptography import x509
+    from cryptography.x509.oid import NameOID
+    from cryptography.exceptions import UnsupportedAlgorithm
+    from cryptography.hazmat.backends import default_backend
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
+    HAS_CRYPTOGRAPHY = True
+except ImportError:
+    HAS_CRYPTOGRAPHY = False
 
 logger = logging.getLogger("fawkes.auth.tls")
 
+if HAS_CRYPTOGRAPHY:
+    # Fixed parts of every self-signed certificate; only the CN varies
+    _SUBJECT_ATTRIBUTES = (
+        x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
+        x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "CA"),
+        x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
+        x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Fawkes"),
+    )
+    _SUBJECT_ALT_NAME = x509.SubjectAlternativeName([
+        x509.DNSName("localhost"),
+        x509.DNSName("*.local"),
+    ])
+
+# Built contexts by create_ssl_context arguments, with the file mtimes they were loaded at
+_context_cache: Dict[tuple, Tuple[tuple, ssl.SSLContext]] = {}
+_context_cache_lock = threading.Lock()
+
+# Resumable client sessions: context -> {server_hostname: SSLSession}.
+# OpenSSL does not cache client sessions itself; they must be handed back
+# to wrap_socket, and only work with the context that created them.
+_client_sessions: "weakref.WeakKeyDictionary[ssl.SSLContext, Dict[Optional[str], ssl.SSLSession]]" = \
+    weakref.WeakKeyDictionary()
+
+# (cert_file, key_file) pairs ensure_certificates has already seen on disk
+_ensured: Set[Tuple[str, str]] = set()
+
+# TLS 1.2 fallback suites (only used where OpenSSL lacks TLS 1.3):
+# forward-secret AEAD only. OpenSSL runs AES-GCM through its EVP layer
+# (AES-NI/PCLMULQDQ where present) whatever this list says.
+_TLS12_CIPHERS = 'ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS'
+
+# Context options applied in one step. No TLS compression (CRIME), fresh
+# (EC)DH keys per handshake, and kernel TLS where available (Python 3.12+)
+# so sendfile() stays zero-copy. Protocol versions are set through
+# minimum_version; the OP_NO_TLS* flags are deprecated since Python 3.10.
+_SECURE_OPTIONS = (ssl.OP_NO_COMPRESSION | ssl.OP_SINGLE_DH_USE | ssl.OP_SINGLE_ECDH_USE
+                   | getattr(ssl, "OP_ENABLE_KTLS", 0))
+
+
+def _write_private_file(path: str, data: bytes, mode: int):
+    """
+    Write data to path, creating the file with the given permissions
+
+    A new file gets its mode from os.open, so it never exists with the
+    umask default. An existing file is truncated and has its mode reset.
+    """
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, mode)
+    except FileExistsError:
+        fd = os.open(path, os.O_WRONLY | os.O_TRUNC)
+        os.fchmod(fd, mode)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
 
 def generate_self_signed_cert(cert_file: str, key_file: str,
                               days_valid: int = 365,
@@ -30,71 +105,53 @@ def generate_self_signed_cert(cert_file: str, key_file: str,
     Returns:
         True if successful
     """
+    if not HAS_CRYPTOGRAPHY:
+        logger.error("cryptography library not installed. Run: pip install cryptography")
+        return False
+
     try:
-        from cryptography import x509
-        from cryptography.x509.oid import NameOID
-        from cryptography.hazmat.primitives import hashes
-        from cryptography.hazmat.backends import default_backend
-        from cryptography.hazmat.primitives.asymmetric import rsa
-        from cryptography.hazmat.primitives import serialization
-
-        # Generate private key
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048,
-            backend=default_backend()
-        )
+        # Generate private key: Ed25519 is a single scalar multiplication,
+        # against hundreds of milliseconds of prime search for RSA-2048.
+        # OpenSSL builds without Ed25519 (e.g. FIPS mode) get ECDSA P-256.
+        try:
+            private_key = ed25519.Ed25519PrivateKey.generate()
+            signature_hash = None  # Ed25519 hashes internally
+        except UnsupportedAlgorithm:
+            private_key = ec.generate_private_key(ec.SECP256R1(), default_backend())
+            signature_hash = hashes.SHA256()
 
         # Create certificate
-        subject = issuer = x509.Name([
-            x509.NameAttribute(NameOID.COUNTRY_NAME, "US"),
-            x509.NameAttribute(NameOID.STATE_OR_PROVINCE_NAME, "CA"),
-            x509.NameAttribute(NameOID.LOCALITY_NAME, "San Francisco"),
-            x509.NameAttribute(NameOID.ORGANIZATION_NAME, "Fawkes"),
-            x509.NameAttribute(NameOID.COMMON_NAME, common_name),
-        ])
+        subject = issuer = x509.Name(
+            _SUBJECT_ATTRIBUTES + (x509.NameAttribute(NameOID.COMMON_NAME, common_name),)
+        )
 
+        now = datetime.now(timezone.utc)
         cert = (
             x509.CertificateBuilder()
             .subject_name(subject)
             .issuer_name(issuer)
             .public_key(private_key.public_key())
             .serial_number(x509.random_serial_number())
-            .not_valid_before(datetime.utcnow())
-            .not_valid_after(datetime.utcnow() + timedelta(days=days_valid))
-            .add_extension(
-                x509.SubjectAlternativeName([
-                    x509.DNSName("localhost"),
-                    x509.DNSName("*.local"),
-                ]),
-                critical=False,
-            )
-            .sign(private_key, hashes.SHA256(), default_backend())
+            .not_valid_before(now)
+            .not_valid_after(now + timedelta(days=days_valid))
+            .add_extension(_SUBJECT_ALT_NAME, critical=False)
+            .sign(private_key, signature_hash, default_backend())
         )
 
-        # Write private key
-        with open(key_file, "wb") as f:
-            f.write(private_key.private_bytes(
-                encoding=serialization.Encoding.PEM,
-                format=serialization.PrivateFormat.TraditionalOpenSSL,
-                encryption_algorithm=serialization.NoEncryption()
-            ))
+        # Write private key, never readable by others even briefly
+        _write_private_file(key_file, private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ), 0o600)
 
         # Write certificate
-        with open(cert_file, "wb") as f:
-            f.write(cert.public_bytes(serialization.Encoding.PEM))
-
-        # Set restrictive permissions on key file
-        os.chmod(key_file, 0o600)
-        os.chmod(cert_file, 0o644)
+        _write_private_file(cert_file, cert.public_bytes(serialization.Encoding.PEM), 0o644)
 
         logger.info(f"Generated self-signed certificate: {cert_file}")
         logger.info(f"Generated private key: {key_file}")
         return True
 
-    except ImportError:
-        logger.error("cryptography library not installed. Run: pip install cryptography")
-        return False
     except Exception as e:
         logger.error(f"Failed to generate certificate: {e}", exc_info=True)
         return False
@@ -108,6 +165,10 @@ def create_ssl_context(cert_file: Optional[str] = None,
     """
     Create an SSL context for TLS connections
 
+    Contexts are cached: repeated calls with the same arguments return the
+    same context until one of the certificate, key or CA files changes on
+    disk. Treat the returned context as shared and do not reconfigure it.
+
     Args:
         cert_file: Path to certificate file
         key_file: Path to private key file
@@ -118,35 +179,65 @@ def create_ssl_context(cert_file: Optional[str] = None,
     Returns:
         SSL context
     """
+    key = (cert_file, key_file, ca_file, is_server, require_client_cert)
+    mtimes = (_mtime_ns(cert_file), _mtime_ns(key_file), _mtime_ns(ca_file))
+
+    with _context_cache_lock:
+        cached = _context_cache.get(key)
+        if cached is not None and cached[0] == mtimes:
+            return cached[1]
+
+        context = _build_ssl_context(cert_file, key_file, ca_file, is_server, require_client_cert)
+        _context_cache[key] = (mtimes, context)
+        return context
+
+
+def _mtime_ns(path: Optional[str]) -> Optional[int]:
+    """Modification time of path in nanoseconds, or None if unset or missing"""
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _build_ssl_context(cert_file: Optional[str], key_file: Optional[str],
+                       ca_file: Optional[str], is_server: bool,
+                       require_client_cert: bool) -> ssl.SSLContext:
+    """Build a new SSL context for create_ssl_context"""
     # Create context with secure defaults
     if is_server:
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
     else:
         context = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
 
-    # Set minimum TLS version
-    context.minimum_version = ssl.TLSVersion.TLSv1_2
-
-    # Disable insecure protocols
-    context.options |= ssl.OP_NO_SSLv2
-    context.options |= ssl.OP_NO_SSLv3
-    context.options |= ssl.OP_NO_TLSv1
-    context.options |= ssl.OP_NO_TLSv1_1
+    # Require TLS 1.3 (one round trip, AEAD suites only) where OpenSSL has it;
+    # the minimum version also rules out SSLv2/SSLv3/TLS 1.0/TLS 1.1
+    if ssl.HAS_TLSv1_3:
+        context.minimum_version = ssl.TLSVersion.TLSv1_3
+    else:
+        context.minimum_version = ssl.TLSVersion.TLSv1_2
+        context.set_ciphers(_TLS12_CIPHERS)
 
-    # Use strong ciphers only
-    context.set_ciphers('ECDHE+AESGCM:ECDHE+CHACHA20:DHE+AESGCM:DHE+CHACHA20:!aNULL:!MD5:!DSS')
+    context.options |= _SECURE_OPTIONS
 
     if is_server:
         # Server context
         if cert_file and key_file:
-            if not os.path.exists(cert_file):
-                raise FileNotFoundError(f"Certificate file not found: {cert_file}")
-            if not os.path.exists(key_file):
-                raise FileNotFoundError(f"Key file not found: {key_file}")
-
-            context.load_cert_chain(cert_file, key_file)
+            try:
+                context.load_cert_chain(cert_file, key_file)
+            except FileNotFoundError:
+                # OpenSSL does not say which file; only check on failure
+                if not os.path.exists(cert_file):
+                    raise FileNotFoundError(f"Certificate file not found: {cert_file}") from None
+                raise FileNotFoundError(f"Key file not found: {key_file}") from None
             logger.debug(f"Loaded server certificate: {cert_file}")
 
+        # Issue session tickets so reconnecting clients can resume without a
+        # full handshake (the OpenSSL default, pinned here)
+        context.num_tickets = 2
+
         if require_client_cert and ca_file:
             context.verify_mode = ssl.CERT_REQUIRED
             context.load_verify_locations(ca_file)
@@ -194,9 +285,13 @@ def wrap_socket_tls(sock: socket.socket, context: ssl.SSLContext,
             tls_sock = context.wrap_socket(sock, server_side=True)
             logger.debug("Wrapped socket as TLS server")
         else:
+            # Resume the last session saved for this server, if any
+            session = _client_sessions.get(context, {}).get(server_hostname)
             tls_sock = context.wrap_socket(sock, server_side=False,
-                                          server_hostname=server_hostname)
-            logger.debug(f"Wrapped socket as TLS client (server: {server_hostname})")
+                                          server_hostname=server_hostname,
+                                          session=session)
+            logger.debug(f"Wrapped socket as TLS client (server: {server_hostname}, "
+                         f"resumed: {tls_sock.session_reused})")
 
         return tls_sock
 
@@ -208,48 +303,196 @@ def wrap_socket_tls(sock: socket.socket, context: ssl.SSLContext,
         raise
 
 
+def wrap_bio_tls(context: ssl.SSLContext, incoming: ssl.MemoryBIO,
+                 outgoing: ssl.MemoryBIO, is_server: bool = True,
+                 server_hostname: Optional[str] = None) -> ssl.SSLObject:
+    """
+    Create a TLS endpoint over in-memory buffers instead of a socket
+
+    The caller moves bytes between the BIOs and the transport. Received
+    data goes into incoming. Encrypted output is read from outgoing. Each
+    SSLObject.write() becomes one TLS record, so join small messages
+    and write them in one call to send them as a single record.
+
+    Args:
+        context: SSL context
+        incoming: BIO the caller feeds with data received from the peer
+        outgoing: BIO the caller drains and sends to the peer
+        is_server: True for server side, False for client
+        server_hostname: Server hostname for client connections
+
+    Returns:
+        SSLObject; drive do_handshake() until it stops raising SSLWantReadError
+    """
+    if is_server:
+        return context.wrap_bio(incoming, outgoing, server_side=True)
+
+    # Resume the last session saved for this server, if any
+    session = _client_sessions.get(context, {}).get(server_hostname)
+    return context.wrap_bio(incoming, outgoing, server_side=False,
+                            server_hostname=server_hostname, session=session)
+
+
+def save_tls_session(sock: socket.socket) -> bool:
+    """
+    Remember a client connection's TLS session for the next wrap_socket_tls
+
+    Call this after reading at least one response, before closing: TLS 1.3
+    servers send their session ticket after the handshake, and the client
+    only sees it once it reads from the connection.
+
+    Args:
+        sock: Client socket from wrap_socket_tls, or SSLObject from
+            wrap_bio_tls (plain sockets are ignored)
+
+    Returns:
+        True if a resumable session was saved
+    """
+    if not isinstance(sock, (ssl.SSLSocket, ssl.SSLObject)) or sock.server_side:
+        return False
+    session = sock.session
+    if session is None or not session.has_ticket:
+        return False
+    _client_sessions.setdefault(sock.context, {})[sock.server_hostname] = session
+    return True
+
+
+async def _loop_start_tls(writer: asyncio.StreamWriter, context: ssl.SSLContext,
+                          server_hostname: Optional[str]) -> None:
+    """
+    StreamWriter.start_tls for Python < 3.11, built on loop.start_tls
+
+    Swaps the TLS transport into the writer and its protocol the same way
+    the 3.11 implementation does.
+    """
+    protocol = writer.transport.get_protocol()
+    server_side = getattr(protocol, "_client_connected_cb", None) is not None
+    await writer.drain()
+    transport = await asyncio.get_running_loop().start_tls(
+        writer.transport, protocol, context,
+        server_side=server_side, server_hostname=server_hostname)
+    writer._transport = transport
+    protocol._transport = transport
+    protocol._over_ssl = True
+
+
+async def wrap_stream_tls(writer: asyncio.StreamWriter, context: ssl.SSLContext,
+                          server_hostname: Optional[str] = None) -> None:
+    """
+    Upgrade an asyncio stream connection to TLS in place
+
+    The handshake runs on the event loop's own TLS implementation (uvloop's
+    native one when uvloop is installed as the loop), instead of a blocking
+    SSLSocket. Whether this is the server side is taken from the stream:
+    connections accepted by asyncio.start_server handshake as servers.
+    The StreamReader paired with writer reads decrypted data afterwards.
+
+    Args:
+        writer: StreamWriter of the connection to upgrade
+        context: SSL context
+        server_hostname: Server hostname for client connections
+    """
+    try:
+        if hasattr(writer, "start_tls"):
+            await writer.start_tls(context, server_hostname=server_hostname)
+        else:
+            await _loop_start_tls(writer, context, server_hostname)
+        logger.debug(f"Upgraded stream to TLS (server: {server_hostname})")
+    except ssl.SSLError as e:
+        logger.error(f"TLS handshake failed: {e}")
+        raise
+
+
+def tls_sendfile(sock: socket.socket, fileobj, offset: int = 0,
+                 count: Optional[int] = None) -> int:
+    """
+    Send a file over a plain or TLS socket
+
+    Plain sockets and kernel-TLS sockets (Python 3.12+, OP_ENABLE_KTLS)
+    use os.sendfile; other TLS sockets fall back to full-record sends.
+
+    Args:
+        sock: Connected socket, optionally TLS-wrapped
+        fileobj: File opened in binary mode
+        offset: Position in the file to start from
+        count: Number of bytes to send (default: to end of file)
+
+    Returns:
+        Number of bytes sent
+    """
+    sent = sock.sendfile(fileobj, offset, count)
+    logger.debug(f"Sent {sent} bytes from {getattr(fileobj, 'name', 'file')}")
+    return sent
+
+
+def _validity_window(cert) -> Tuple[float, float]:
+    """Return a certificate's notBefore and notAfter as Unix timestamps"""
+    try:
+        # Timezone-aware properties (cryptography 42+)
+        return cert.not_valid_before_utc.timestamp(), cert.not_valid_after_utc.timestamp()
+    except AttributeError:
+        # Older releases return naive datetimes in UTC
+        return (cert.not_valid_before.replace(tzinfo=timezone.utc).timestamp(),
+                cert.not_valid_after.replace(tzinfo=timezone.utc).timestamp())
+
+
 def verify_certificate(cert_file: str, ca_file: Optional[str] = None) -> bool:
     """
     Verify a certificate
 
+    Every certificate in the file is checked, so a PEM bundle is valid
+    only if none of its certificates is expired or not yet valid.
+
     Args:
-        cert_file: Path to certificate to verify
+        cert_file: Path to certificate (or PEM bundle) to verify
         ca_file: Optional CA certificate to verify against
 
     Returns:
         True if certificate is valid
     """
-    try:
-        from cryptography import x509
-        from cryptography.hazmat.backends import default_backend
+    if not HAS_CRYPTOGRAPHY:
+        logger.error("cryptography library not installed")
+        return False
 
+    try:
         with open(cert_file, "rb") as f:
-            cert = x509.load_pem_x509_certificate(f.read(), default_backend())
-
-        # Check if certificate is expired
-        now = datetime.utcnow()
-        if now < cert.not_valid_before:
-            logger.error("Certificate not yet valid")
-            return False
-        if now > cert.not_valid_after:
-            logger.error("Certificate expired")
-            return False
-
-        logger.info(f"Certificate valid: {cert.subject}")
+            pem_data = f.read()
+
+        # One pass over all PEM blocks (cryptography 39+)
+        if hasattr(x509, "load_pem_x509_certificates"):
+            certs = x509.load_pem_x509_certificates(pem_data)
+        else:
+            certs = [x509.load_pem_x509_certificate(pem_data, default_backend())]
+
+        # Check if any certificate is expired
+        now = time.time()
+        for cert in certs:
+            not_before, not_after = _validity_window(cert)
+            if now < not_before:
+                logger.error(f"Certificate not yet valid: {cert.subject}")
+                return False
+            if now > not_after:
+                logger.error(f"Certificate expired: {cert.subject}")
+                return False
+
+        if len(certs) == 1:
+            logger.info(f"Certificate valid: {certs[0].subject}")
+        else:
+            logger.info(f"All {len(certs)} certificates valid in {cert_file}")
         return True
 
-    except ImportError:
-        logger.error("cryptography library not installed")
-        return False
     except Exception as e:
         logger.error(f"Failed to verify certificate: {e}", exc_info=True)
         return False
 
 
+@lru_cache(maxsize=1)
 def get_default_cert_paths() -> Tuple[str, str]:
     """
     Get default paths for certificate and key files
 
+    The paths are resolved, and their directory created, once per process.
+
     Returns:
         Tuple of (cert_file, key_file)
     """
@@ -267,6 +510,9 @@ def ensure_certificates(cert_file: Optional[str] = None,
     """
     Ensure certificates exist, generating them if necessary
 
+    Each pair is checked on disk once per process; later calls for the
+    same paths return without touching the filesystem.
+
     Args:
         cert_file: Optional certificate file path
         key_file: Optional key file path
@@ -277,9 +523,17 @@ def ensure_certificates(cert_file: Optional[str] = None,
     if cert_file is None or key_file is None:
         cert_file, key_file = get_default_cert_paths()
 
-    if not os.path.exists(cert_file) or not os.path.exists(key_file):
+    pair = (cert_file, key_file)
+    if pair in _ensured:
+        return pair
+
+    try:
+        os.stat(cert_file)
+        os.stat(key_file)
+    except OSError:
         logger.info("Certificates not found, generating self-signed certificate...")
         if not generate_self_signed_cert(cert_file, key_file):
             raise RuntimeError("Failed to generate certificates")
 
-    return cert_file, key_file
+    _ensured.add(pair)
+    return pair
@@ -417,7 +417,8 @@ class AuthDB:
                       (int(time.time()), key_id))
         self.conn.commit()
 
-        permissions = json.loads(permissions_json) if permissions_json else []
+        # frozenset, so require_permission checks are a hash probe
+        permissions = frozenset(json.loads(permissions_json)) if permissions_json else frozenset()
 
         return {
             "key_id": key_id,
@@ -503,7 +504,8 @@ class AuthDB:
                       (int(time.time()), session_id))
         self.conn.commit()
 
-        permissions = json.loads(permissions_json) if permissions_json else []
+        # frozenset, so require_permission checks are a hash probe
+        permissions = frozenset(json.loads(permissions_json)) if permissions_json else frozenset()
 
         return {
             "session_id": session_id,
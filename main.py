@@ -68,8 +68,10 @@ def main():
     if args.analyze_crashes:
         from analysis import load_analyzer
         analyzer = load_analyzer(cfg.arch, cfg.crash_dir)
-        for crash_zip in glob.glob(os.path.join(cfg.crash_dir, "*.zip")):
-            analyzer.analyze_crash(crash_zip)
+        try:
+            analyzer.analyze_crashes(glob.glob(os.path.join(cfg.crash_dir, "*.zip")))
+        finally:
+            analyzer.close()
         return
 
     # Check to make sure users aren't using exclusive flags
@@ -12,7 +12,7 @@ from db.controller_db import ControllerDB
 from db.auth_db import AuthDB
 from globals import shutdown_event
 from auth.middleware import add_authentication, AuthenticationError
-from auth.tls import create_ssl_context, ensure_certificates
+from auth.tls import create_ssl_context, ensure_certificates, save_tls_session, tls_sendfile, wrap_socket_tls
 
 logger = logging.getLogger("fawkes")
 CONTROLLER_PORT = 9999
@@ -65,7 +65,7 @@ def push_job_to_worker(worker_ip: str, job_config: dict, cfg: dict = None):
                     key_file=key_file,
                     is_server=False
                 )
-                sock = ssl_context.wrap_socket(sock, server_hostname=worker_ip)
+                sock = wrap_socket_tls(sock, ssl_context, is_server=False, server_hostname=worker_ip)
                 logger.debug(f"Established TLS connection to {worker_ip}")
             except Exception as e:
                 logger.error(f"TLS handshake failed with {worker_ip}: {e}")
@@ -87,16 +87,12 @@ def push_job_to_worker(worker_ip: str, job_config: dict, cfg: dict = None):
             msg = add_authentication(msg, "api_key", api_key)
 
         msg_data = json.dumps(msg).encode()
-        sock.send(len(msg_data).to_bytes(4, byteorder="big"))
-        sock.send(msg_data)
+        # Length prefix and body in one send (one TLS record)
+        sock.sendall(len(msg_data).to_bytes(4, byteorder="big") + msg_data)
         logger.debug(f"Sent job config to {worker_ip}: {job_config['job_id']}")
 
         with open(tar_path, "rb") as f:
-            while True:
-                chunk = f.read(4096)
-                if not chunk:
-                    break
-                sock.send(chunk)
+            tls_sendfile(sock, f)
         logger.info(f"Sent job package to {worker_ip} for job {job_config['job_id']}")
 
         ack = sock.recv(1024).decode()
@@ -118,6 +114,7 @@ def push_job_to_worker(worker_ip: str, job_config: dict, cfg: dict = None):
         return False
     finally:
         if sock:
+            save_tls_session(sock)
             sock.close()
         if os.path.exists(tar_path):
             os.unlink(tar_path)
@@ -185,7 +182,7 @@ def run_controller_mode(cfg):
 
                 # Wrap with TLS if enabled
                 if tls_enabled and ssl_context:
-                    sock = ssl_context.wrap_socket(sock, server_hostname=worker["ip_address"])
+                    sock = wrap_socket_tls(sock, ssl_context, is_server=False, server_hostname=worker["ip_address"])
 
                 # Request status
                 status_msg = {"type": "STATUS_REQUEST"}
@@ -241,6 +238,7 @@ def run_controller_mode(cfg):
                 logger.warning(f"Worker {worker['ip_address']} offline: {e}")
             finally:
                 if sock:
+                    save_tls_session(sock)
                     sock.close()
 
         check_for_new_jobs(db, cfg)
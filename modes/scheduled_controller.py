@@ -24,7 +24,7 @@ from fawkes.db.scheduler_db import SchedulerDB
 from fawkes.scheduler.scheduler import SchedulerOrchestrator
 from globals import shutdown_event
 from auth.middleware import add_authentication
-from auth.tls import create_ssl_context, ensure_certificates
+from auth.tls import create_ssl_context, ensure_certificates, save_tls_session, tls_sendfile, wrap_socket_tls
 
 logger = logging.getLogger("fawkes.controller")
 CONTROLLER_PORT = 9999
@@ -78,7 +78,7 @@ def push_job_to_worker(worker_ip: str, job_config: dict, cfg: dict = None):
                     key_file=key_file,
                     is_server=False
                 )
-                sock = ssl_context.wrap_socket(sock, server_hostname=worker_ip)
+                sock = wrap_socket_tls(sock, ssl_context, is_server=False, server_hostname=worker_ip)
                 logger.debug(f"Established TLS connection to {worker_ip}")
             except Exception as e:
                 logger.error(f"TLS handshake failed with {worker_ip}: {e}")
@@ -100,16 +100,12 @@ def push_job_to_worker(worker_ip: str, job_config: dict, cfg: dict = None):
             msg = add_authentication(msg, "api_key", api_key)
 
         msg_data = json.dumps(msg).encode()
-        sock.send(len(msg_data).to_bytes(4, byteorder="big"))
-        sock.send(msg_data)
+        # Length prefix and body in one send (one TLS record)
+        sock.sendall(len(msg_data).to_bytes(4, byteorder="big") + msg_data)
         logger.debug(f"Sent job config to {worker_ip}: {job_config['job_id']}")
 
         with open(tar_path, "rb") as f:
-            while True:
-                chunk = f.read(4096)
-                if not chunk:
-                    break
-                sock.send(chunk)
+            tls_sendfile(sock, f)
         logger.info(f"Sent job package to {worker_ip} for job {job_config['job_id']}")
 
         ack = sock.recv(1024).decode()
@@ -131,6 +127,7 @@ def push_job_to_worker(worker_ip: str, job_config: dict, cfg: dict = None):
         return False
     finally:
         if sock:
+            save_tls_session(sock)
             sock.close()
         if 'tar_path' in locals() and os.path.exists(tar_path):
             os.unlink(tar_path)
@@ -159,7 +156,7 @@ def collect_worker_status(worker_ip: str, cfg: dict = None) -> dict:
                 key_file=key_file,
                 is_server=False
             )
-            sock = ssl_context.wrap_socket(sock, server_hostname=worker_ip)
+            sock = wrap_socket_tls(sock, ssl_context, is_server=False, server_hostname=worker_ip)
 
         # Request status
         status_msg = {"type": "STATUS_REQUEST"}
@@ -191,6 +188,7 @@ def collect_worker_status(worker_ip: str, cfg: dict = None) -> dict:
         return {}
     finally:
         if sock:
+            save_tls_session(sock)
             sock.close()
 
 
@@ -217,7 +215,7 @@ def collect_worker_crashes(worker_ip: str, job_id: int, cfg: dict = None) -> lis
                 key_file=key_file,
                 is_server=False
             )
-            sock = ssl_context.wrap_socket(sock, server_hostname=worker_ip)
+            sock = wrap_socket_tls(sock, ssl_context, is_server=False, server_hostname=worker_ip)
 
         crash_msg = {"type": "CRASH_REQUEST", "job_id": job_id}
 
@@ -250,6 +248,7 @@ def collect_worker_crashes(worker_ip: str, job_id: int, cfg: dict = None) -> lis
         return []
     finally:
         if sock:
+            save_tls_session(sock)
             sock.close()
 
 
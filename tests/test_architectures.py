@@ -0,0 +1,72 @@
+"""
+Tests for arch/architectures.py - SupportedArchitectures lookups.
+"""
+
+import pytest
+
+from arch.architectures import SupportedArchitectures
+
+
+class TestArchitectureLookup:
+    """Tests for name and alias resolution."""
+
+    @pytest.mark.parametrize("name, expected", [
+        ("x86_64", "x86_64"),
+        ("amd64", "x86_64"),
+        ("ppc64el", "ppc64le"),
+        ("z/Architecture", "s390x"),
+        ("arm64", "aarch64"),
+    ])
+    def test_resolves_names_and_aliases(self, name, expected):
+        """Test that canonical names and aliases map to the same entry."""
+        assert SupportedArchitectures.get_architecture(name).name == expected
+
+    def test_every_alias_resolves_to_its_owner(self):
+        """Test the index against the architecture table."""
+        for name, arch_info in SupportedArchitectures.ARCHITECTURES.items():
+            assert SupportedArchitectures.get_architecture(name) is arch_info
+            for alias in arch_info.aliases or ():
+                assert SupportedArchitectures.get_architecture(alias) is arch_info
+                assert SupportedArchitectures.get_qemu_binary(alias) == arch_info.qemu_binary
+                assert SupportedArchitectures.get_register_set(alias) is arch_info.registers
+
+    def test_table_is_read_only(self):
+        """Test that callers cannot modify the shared architecture table."""
+        with pytest.raises(TypeError):
+            SupportedArchitectures.ARCHITECTURES["vax"] = SupportedArchitectures.get_architecture("i386")
+
+    def test_unknown_architecture(self):
+        """Test that unknown names are rejected."""
+        assert SupportedArchitectures.get_architecture("vax") is None
+        assert SupportedArchitectures.get_qemu_binary("vax") is None
+        assert SupportedArchitectures.get_gdb_arch("vax") is None
+        assert SupportedArchitectures.get_register_set("vax") is None
+        assert not SupportedArchitectures.validate_architecture("vax")
+
+
+class TestArchitectureFamilies:
+    """Tests for family grouping."""
+
+    def test_families_cover_every_architecture_once(self):
+        """Test that each architecture sits in exactly one family."""
+        members = [arch for archs in SupportedArchitectures.get_architecture_families().values() for arch in archs]
+        assert sorted(members) == sorted(SupportedArchitectures.ARCHITECTURES)
+
+    def test_family_of_name_and_alias(self):
+        """Test reverse family lookups."""
+        assert SupportedArchitectures.get_architecture_family("ppc64le") == "PowerPC"
+        assert SupportedArchitectures.get_architecture_family("amd64") == "x86"
+        assert SupportedArchitectures.get_architecture_family("vax") is None
+        assert SupportedArchitectures.get_architecture_family("") is None
+
+
+class TestRegisterSets:
+    """Tests for the register definitions."""
+
+    def test_identical_register_lists_are_shared(self):
+        """Test that architectures with the same registers share one tuple."""
+        mips = SupportedArchitectures.get_register_set("mips")
+        mipsel = SupportedArchitectures.get_register_set("mipsel")
+        assert isinstance(mips.general_purpose, tuple)
+        assert mips.general_purpose is mipsel.general_purpose
+        assert mips.arguments is mipsel.arguments
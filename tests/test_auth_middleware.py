@@ -0,0 +1,162 @@
+"""
+Tests for auth/middleware.py - request authentication and authorization.
+"""
+
+import pytest
+
+from auth.middleware import (
+    AuthenticationError,
+    AuthorizationError,
+    add_authentication,
+    authenticate_request,
+    authenticated,
+    authorized,
+    bind_validators,
+    require_auth,
+    require_permission,
+)
+
+
+class StubAuthDB:
+    """Minimal AuthDB with one API key and one session."""
+
+    def validate_api_key(self, api_key):
+        if api_key == "good-key":
+            return {"key_name": "worker-1", "permissions": frozenset(["job:read"])}
+        return None
+
+    def validate_session(self, token):
+        if token == "good-token":
+            return {"username": "admin", "permissions": frozenset(["job:read", "job:create"])}
+        return None
+
+
+@pytest.fixture
+def auth_db():
+    return StubAuthDB()
+
+
+class TestAuthenticateRequest:
+    """Tests for authenticate_request."""
+
+    @pytest.mark.parametrize("auth_type, credential, field, name", [
+        ("api_key", "good-key", "key_name", "worker-1"),
+        ("session_token", "good-token", "username", "admin"),
+    ])
+    def test_valid_credentials(self, auth_db, auth_type, credential, field, name):
+        """Test that each auth type resolves its principal."""
+        message = add_authentication({"type": "PING"}, auth_type, credential)
+        assert authenticate_request(auth_db, message)[field] == name
+
+    @pytest.mark.parametrize("message, error", [
+        ({}, "No authentication provided"),
+        ({"auth_type": "password"}, "Unknown authentication type: password"),
+        ({"auth_type": ["api_key"]}, "Unknown authentication type"),
+        ({"auth_type": "api_key"}, "API key missing"),
+        ({"auth_type": "session_token", "session_token": ""}, "Session token missing"),
+        ({"auth_type": "api_key", "api_key": "bad"}, "Invalid or expired API key"),
+        ({"auth_type": "session_token", "session_token": "bad"}, "Invalid or expired session token"),
+    ])
+    def test_rejections(self, auth_db, message, error):
+        """Test the error raised for each kind of bad request."""
+        with pytest.raises(AuthenticationError, match=error):
+            authenticate_request(auth_db, message)
+        with pytest.raises(AuthenticationError, match=error):
+            authenticate_request(auth_db, message, bind_validators(auth_db))
+
+
+class TestRequirePermission:
+    """Tests for require_permission."""
+
+    @pytest.mark.parametrize("permissions", [frozenset(["job:read"]), ["job:read"]])
+    def test_granted_and_denied(self, permissions):
+        """Test permission checks against set and list principals."""
+        principal = {"key_name": "worker-1", "permissions": permissions}
+        assert require_permission(principal, "job:read")
+        with pytest.raises(AuthorizationError, match="job:create"):
+            require_permission(principal, "job:create")
+
+    def test_principal_without_permissions(self):
+        """Test that a principal with no permissions is denied."""
+        with pytest.raises(AuthorizationError):
+            require_permission({"username": "guest"}, "job:read")
+
+
+class TestDecorators:
+    """Tests for the authentication and authorization decorators."""
+
+    def test_stacked_decorators(self, auth_db):
+        """Test @authenticated with @authorized on a permitted request."""
+        @authenticated(lambda: auth_db)
+        @authorized("job:read", "job:create")
+        def handler(message, principal):
+            return principal["username"]
+
+        assert handler(add_authentication({}, "session_token", "good-token")) == "admin"
+        with pytest.raises(AuthorizationError, match="Permission denied: job:create"):
+            handler(add_authentication({}, "api_key", "good-key"))
+
+    def test_eager_authenticated(self, auth_db):
+        """Test that lazy=False resolves the AuthDB at decoration time."""
+        calls = []
+
+        def get_auth_db():
+            calls.append(1)
+            return auth_db
+
+        @authenticated(get_auth_db, lazy=False)
+        def handler(message, principal):
+            return principal["key_name"]
+
+        assert len(calls) == 1
+        assert handler(add_authentication({}, "api_key", "good-key")) == "worker-1"
+        assert len(calls) == 1
+
+    def test_require_auth_fetches_auth_db_once(self, auth_db):
+        """Test the fused decorator and its cached AuthDB."""
+        calls = []
+
+        def get_auth_db():
+            calls.append(1)
+            return auth_db
+
+        @require_auth(get_auth_db, "job:create", "job:read")
+        def handler(message, principal):
+            return principal["username"]
+
+        message = add_authentication({}, "session_token", "good-token")
+        assert handler(message) == "admin"
+        assert handler(message) == "admin"
+        assert len(calls) == 1
+
+        with pytest.raises(AuthorizationError, match="Permission denied: job:create"):
+            handler(add_authentication({}, "api_key", "good-key"))
+        with pytest.raises(AuthenticationError):
+            handler({})
+
+
+class TestLogging:
+    """Tests for middleware log records."""
+
+    def test_denied_permission_is_logged(self, caplog):
+        """Test that lazily formatted warnings still name the principal."""
+        with caplog.at_level("WARNING", logger="fawkes.auth"):
+            with pytest.raises(AuthorizationError):
+                require_permission({"username": "guest", "permissions": frozenset()}, "job:read")
+        assert caplog.messages == ["Permission denied: job:read for guest"]
+
+
+class TestAddAuthentication:
+    """Tests for add_authentication."""
+
+    def test_sets_credential_field(self):
+        """Test that each auth type writes its own credential field."""
+        assert add_authentication({}, "api_key", "k") == {"auth_type": "api_key", "api_key": "k"}
+        assert add_authentication({}, "session_token", "t") == {"auth_type": "session_token", "session_token": "t"}
+
+    def test_unknown_type_leaves_message_untouched(self):
+        """Test that an unknown auth type is rejected before any field is set."""
+        message = {"type": "PING"}
+        with pytest.raises(ValueError, match="Unknown auth type: password"):
+            add_authentication(message, "password", "secret")
+        assert message == {"type": "PING"}
@@ -0,0 +1,148 @@
+"""
+Tests for analysis/enhanced_triage.py - EnhancedTriageEngine pattern matching.
+"""
+
+import hashlib
+import os
+import time
+import zipfile
+import pytest
+
+from analysis.enhanced_triage import EnhancedTriageEngine, VulnType
+
+
+@pytest.fixture(scope="module")
+def engine():
+    return EnhancedTriageEngine()
+
+
+def _write_crash_zip(path, gdb_output):
+    with zipfile.ZipFile(path, "w") as zf:
+        # Fixed timestamp, so equal output gives byte-identical zips
+        zf.writestr(zipfile.ZipInfo("gdb_output.txt", date_time=(2024, 1, 1, 0, 0, 0)), gdb_output)
+    return str(path)
+
+
+def _crash_data(raw_output, registers=None):
+    return {"raw_output": raw_output, "exception": "", "registers": registers or {}}
+
+
+class TestPatternMatching:
+    """Tests for vulnerability and exploit pattern detection."""
+
+    def test_detects_heap_overflow_next_to_other_patterns(self, engine):
+        """Test that a match of one pattern does not hide another on the same line."""
+        data = _crash_data("use after free detected, invalid next size\n")
+        vuln_type, confidence = engine._detect_vulnerability_type(data)
+        assert vuln_type == VulnType.HEAP_OVERFLOW
+        assert confidence == 1.0
+
+    def test_detects_pc_control_indicator(self, engine):
+        """Test the PC control indicator on a GDB register line."""
+        score, indicators = engine._analyze_exploitability(_crash_data("rip = 0x4141414141414141\n"))
+        assert "PC Control" in indicators
+        assert score > 0
+
+    def test_mitigations_match_whole_words(self, engine):
+        """Test that mitigation keywords inside longer words are ignored."""
+        assert engine._detect_mitigations(_crash_data("NXDOMAIN at depth 3, cfiX\n")) == []
+
+    def test_mitigations_in_fixed_order(self, engine):
+        """Test that mitigations are reported in a stable order."""
+        data = _crash_data("CFI enabled; ASLR on; NX stack\n__stack_chk_fail\n")
+        assert engine._detect_mitigations(data) == ["Stack Canary", "ASLR/PIE", "DEP/NX", "CFI"]
+
+    @pytest.mark.parametrize("raw_output", [
+        "a" * 100000 + "!",
+        "rsp " * 25000,
+        "pc " * 30000,
+        "heap " * 20000,
+        "%s " * 30000,
+        "sudo uid " * 10000,
+    ])
+    def test_patterns_do_not_backtrack_catastrophically(self, engine, raw_output):
+        """Test that hostile GDB output is scanned in roughly linear time."""
+        data = _crash_data(raw_output)
+        start = time.perf_counter()
+        engine._detect_vulnerability_type(data)
+        engine._analyze_exploitability(data)
+        engine._find_similar_cves(data, VulnType.UNKNOWN)
+        engine._detect_control_flow_hijack(data)
+        assert time.perf_counter() - start < 5.0
+
+
+class TestDedupKeys:
+    """Tests for stack hash and signature digests."""
+
+    @pytest.mark.skipif(os.environ.get("FAWKES_FAST_HASH") == "1", reason="fast hashing opted in")
+    def test_default_digests_are_sha256(self, engine):
+        """Test that dedup keys do not depend on optional hash libraries by default."""
+        assert engine._generate_stack_hash(["vuln ()", "main ()"]) == hashlib.sha256(b"vuln|main").hexdigest()[:16]
+        data = {"exception": "SIGSEGV", "fault_address": "0x0", "stack_frames": ["vuln ()"]}
+        assert engine._generate_signature(data) == hashlib.sha256(b"SIGSEGV:0x0:vuln ()").hexdigest()
+
+
+class TestBatchAnalysis:
+    """Tests for analyze_crashes."""
+
+    def test_matches_single_crash_analysis(self, engine, tmp_path):
+        """Test that the process pool returns the same results, in input order."""
+        outputs = [
+            "Program received signal SIGSEGV, Segmentation fault.\n#0  0x0000000000401136 in vuln ()\nrip = 0x4141414141414141\n",
+            "free(): invalid next size (fast)\n#0  0x00007ffff7a42428 in raise ()\n#1  0x00007ffff7a4402a in abort ()\n",
+            "",
+        ]
+        crash_zips = [_write_crash_zip(tmp_path / f"crash_{i}.zip", output) for i, output in enumerate(outputs)]
+
+        results = engine.analyze_crashes(crash_zips, max_workers=2)
+
+        assert [r.to_dict() for r in results] == [engine.analyze_crash(p).to_dict() for p in crash_zips]
+
+    def test_empty_batch(self, engine):
+        """Test that an empty batch does not start a pool."""
+        assert engine.analyze_crashes([]) == []
+
+
+class TestResultCache:
+    """Tests for the analyze_crash fingerprint cache."""
+
+    GDB_OUTPUT = "Program received signal SIGSEGV\n#0  0x0000000000401136 in vuln ()\nrip = 0x4141414141414141\n"
+
+    def test_identical_zip_reuses_result(self, tmp_path):
+        """Test that a copy of a triaged zip hits the cache under its own name."""
+        engine = EnhancedTriageEngine()
+        first = engine.analyze_crash(_write_crash_zip(tmp_path / "a.zip", self.GDB_OUTPUT))
+        second = engine.analyze_crash(_write_crash_zip(tmp_path / "b.zip", self.GDB_OUTPUT))
+
+        assert second.crash_id == "b.zip"
+        assert dict(second.to_dict(), crash_id="a.zip") == first.to_dict()
+        assert len(engine._cache) == 1
+
+    def test_cached_results_do_not_share_lists(self, tmp_path):
+        """Test that editing a returned result leaves later cache hits untouched."""
+        engine = EnhancedTriageEngine()
+        first = engine.analyze_crash(_write_crash_zip(tmp_path / "a.zip", self.GDB_OUTPUT))
+        expected = first.to_dict()
+        first.triage_notes.append("reviewed")
+        first.registers["rip"] = "0x0"
+
+        second = engine.analyze_crash(_write_crash_zip(tmp_path / "b.zip", self.GDB_OUTPUT))
+        second.stack_frames.clear()
+        third = engine.analyze_crash(_write_crash_zip(tmp_path / "c.zip", self.GDB_OUTPUT))
+
+        assert dict(third.to_dict(), crash_id="a.zip") == expected
+
+    def test_cache_is_bounded(self, tmp_path):
+        """Test that the least recently used result is evicted."""
+        engine = EnhancedTriageEngine(cache_size=1)
+        engine.analyze_crash(_write_crash_zip(tmp_path / "a.zip", self.GDB_OUTPUT))
+        engine.analyze_crash(_write_crash_zip(tmp_path / "b.zip", "free(): invalid pointer\n"))
+
+        assert len(engine._cache) == 1
+
+    def test_cache_disabled(self, tmp_path):
+        """Test that cache_size=0 keeps nothing."""
+        engine = EnhancedTriageEngine(cache_size=0)
+        engine.analyze_crash(_write_crash_zip(tmp_path / "a.zip", self.GDB_OUTPUT))
+
+        assert not engine._cache
@@ -0,0 +1,178 @@
+"""
+Tests for analysis/report_generator.py - ReportGenerator and summary reports.
+"""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from analysis.enhanced_triage import CrashAnalysis, Severity, VulnType
+from analysis.report_generator import ReportGenerator, generate_summary_report
+
+
+def _analysis(**overrides):
+    fields = dict(
+        crash_id="crash_1.zip",
+        signature="ab" * 16,
+        stack_hash="0123456789abcdef",
+        severity=Severity.HIGH,
+        exploitability_score=75,
+        vuln_type=VulnType.HEAP_OVERFLOW,
+        vuln_class="Memory Corruption",
+        control_flow_hijack=False,
+        memory_corruption=True,
+        controlled_data=False,
+        stack_frames=["main", "parse"],
+        registers={"rip": "0x401136", "rax": "0x0"},
+        fault_address="0xdeadbeef",
+        crash_instruction=None,
+        confidence=0.9,
+        indicators=["Heap Metadata Corruption"],
+        mitigations=[],
+        root_cause=None,
+        suggested_fix=None,
+        similar_cves=[],
+        triage_notes=[],
+    )
+    fields.update(overrides)
+    return CrashAnalysis(**fields)
+
+
+@pytest.fixture
+def generator(tmp_path):
+    return ReportGenerator(str(tmp_path))
+
+
+class TestTextReport:
+    """Tests for generate_text_report."""
+
+    def test_sections_are_separated_by_blank_lines(self, generator):
+        """Test the section layout, including omitted empty sections."""
+        lines = generator.generate_text_report(_analysis()).split("\n")
+        banner = "=" * 80
+        titles = [lines[i + 1] for i in range(len(lines) - 2) if lines[i] == banner == lines[i + 2]]
+        assert titles == [
+            "FAWKES CRASH TRIAGE REPORT", "SEVERITY ASSESSMENT", "VULNERABILITY CLASSIFICATION",
+            "EXPLOIT INDICATORS", "STACK TRACE", "REGISTERS", "CRASH DETAILS", "RECOMMENDATIONS", "END OF REPORT",
+        ]
+        start = lines.index("REGISTERS")
+        assert lines[start + 2:start + 6] == ["", "  rax      = 0x0", "  rip      = 0x401136", ""]
+        assert lines[-1] == banner
+
+    def test_crash_details_without_fault_info(self, generator):
+        """Test that the crash details section keeps its blank lines when empty."""
+        report = generator.generate_text_report(_analysis(fault_address=None))
+        assert "CRASH DETAILS\n" + "=" * 80 + "\n\n\n" + "=" * 80 in report
+
+
+class TestJsonReport:
+    """Tests for generate_json_report."""
+
+    def test_round_trips_analysis(self, generator):
+        """Test that the report embeds to_dict() and the given timestamp."""
+        analysis = _analysis(crash_id="crash_ü.zip")
+        now = datetime(2024, 1, 2, 3, 4, 5)
+        report = json.loads(generator.generate_json_report(analysis, now))
+        assert report["generated"] == "2024-01-02T03:04:05"
+        assert report["crash_analysis"] == analysis.to_dict()
+
+    def test_uses_precomputed_dict(self, generator):
+        """Test that a precomputed analysis dict is embedded as given."""
+        report = json.loads(generator.generate_json_report(_analysis(), analysis_dict={"crash_id": "x"}))
+        assert report["crash_analysis"] == {"crash_id": "x"}
+
+
+class TestMarkdownReport:
+    """Tests for generate_markdown_report."""
+
+    def test_code_blocks_and_trailing_newline(self, generator):
+        """Test fenced stack and register blocks and the final newline."""
+        report = generator.generate_markdown_report(_analysis())
+        assert "## 📋 Stack Trace\n\n```\n#0: main\n#1: parse\n```\n\n## 🔧 Registers" in report
+        assert report.startswith("# Crash Report: crash_1.zip\n\n**Generated**: ")
+        assert report.endswith("rip      = 0x401136\n```\n")
+
+
+class TestSaveReport:
+    """Tests for save_report."""
+
+    def test_formats_share_one_timestamp(self, generator):
+        """Test that file names and every format carry the same time."""
+        saved = generator.save_report(_analysis())
+        with open(saved["json"], encoding="utf-8") as f:
+            generated = datetime.fromisoformat(json.load(f)["generated"])
+        stamp = generated.strftime("%Y-%m-%d %H:%M:%S")
+
+        assert saved["text"].endswith(f"_{generated.strftime('%Y%m%d_%H%M%S')}.txt")
+        with open(saved["text"], encoding="utf-8") as f:
+            assert f"Generated: {stamp}\n" in f.read()
+        with open(saved["markdown"], encoding="utf-8") as f:
+            assert f"**Generated**: {stamp}\n" in f.read()
+
+    def test_only_requested_formats_are_generated(self, generator, monkeypatch):
+        """Test that unrequested formats are never built."""
+        def fail(*args):
+            raise AssertionError("text report generated")
+        monkeypatch.setattr(generator, "_iter_text_report", fail)
+        monkeypatch.setattr(generator, "_iter_markdown_report", fail)
+
+        saved = generator.save_report(_analysis(), formats=["json"])
+        assert list(saved) == ["json"]
+
+    def test_batch_save(self, generator):
+        """Test save_reports against per-crash save_report output."""
+        analyses = [
+            _analysis(crash_id="a.zip", stack_hash="aaaaaaaaaaaaaaaa"),
+            _analysis(crash_id="b.zip", stack_hash="bbbbbbbbbbbbbbbb", severity=Severity.CRITICAL),
+        ]
+        saved = generator.save_reports(analyses, formats=["text", "markdown"])
+
+        assert set(saved) == {"a.zip", "b.zip"}
+        for analysis in analyses:
+            files = saved[analysis.crash_id]
+            assert list(files) == ["text", "markdown"]
+            with open(files["text"], encoding="utf-8") as f:
+                text = f.read()
+            assert f"Crash ID: {analysis.crash_id}\n" in text
+            assert f"Severity: {analysis.severity.value}\n" in text
+
+    def test_batch_save_empty(self, generator):
+        """Test that an empty batch writes nothing."""
+        assert generator.save_reports([]) == {}
+
+    def test_context_manager_stops_writer_pool(self, tmp_path):
+        """Test that leaving the with block shuts the writer pool down."""
+        with ReportGenerator(str(tmp_path)) as generator:
+            generator.save_report(_analysis(), formats=["text"])
+            executor = generator._executor
+            assert executor is not None
+        assert generator._executor is None
+        assert executor._shutdown
+
+        # A closed generator starts a fresh pool on its next save
+        assert "text" in generator.save_report(_analysis(), formats=["text"])
+        generator.close()
+
+
+class TestSummaryReport:
+    """Tests for generate_summary_report."""
+
+    def test_empty_batch(self):
+        """Test that an empty batch reports zeros instead of dividing by zero."""
+        report = generate_summary_report([])
+        assert "  Total Crashes: 0\n  Unique Crashes: 0\n  Duplicate Rate: 0.0%\n" in report
+
+    def test_percentages_and_top_order(self):
+        """Test breakdown percentages and stable ordering of equal scores."""
+        analyses = [
+            _analysis(crash_id="a.zip", exploitability_score=50),
+            _analysis(crash_id="b.zip", exploitability_score=90, severity=Severity.CRITICAL),
+            _analysis(crash_id="c.zip", exploitability_score=50, stack_hash="fedcba9876543210"),
+            _analysis(crash_id="d.zip", exploitability_score=10),
+        ]
+        report = generate_summary_report(analyses)
+        assert "  Critical    :   1 ( 25.0%)\n  High        :   3 ( 75.0%)\n" in report
+        assert "  Duplicate Rate: 50.0%\n" in report
+        ranked = [line.split(". ")[1] for line in report.split("\n") if line[:5].strip().rstrip(".").isdigit()]
+        assert ranked == ["b.zip", "a.zip", "c.zip", "d.zip"]